@@ -3,21 +3,28 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
+import threading
 
+from contextlib import asynccontextmanager
 from datetime import datetime, date, timezone
 from enum import Enum
-from typing import Any, Dict, List, Literal, Optional, Sequence
+from functools import lru_cache
+from typing import Annotated, Any, AsyncIterator, Dict, List, Literal, Optional, Sequence, Tuple
 
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from fastapi import Body, FastAPI, HTTPException, Query, WebSocket
+from fastapi import Body, FastAPI, HTTPException, Request, Response, WebSocket
 from fastapi import WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import AfterValidator, BaseModel, Field, TypeAdapter
 from uvicorn.protocols.utils import ClientDisconnected
 
 from configuration import (
+    FolderTemplate,
+    TagSlot,
     get_catalog_data,
     get_context_tag_guidelines,
     get_folder_templates,
@@ -27,11 +34,15 @@ from configuration import (
 from database import (
     filter_activity_summary,
     find_suggestion_by_uid,
+    find_suggestions_by_uids,
     get_monitored_folders,
     init_db,
-    list_suggestions,
+    iter_suggestions,
+    list_suggestions_with_counts,
     mark_failed,
     mark_moved,
+    record_bulk_outcomes,
+    record_decided_move,
     record_decision,
     record_dry_run,
     set_analysis_module,
@@ -48,22 +59,31 @@ from rescan_control import (
     RescanStatus,
     controller as rescan_controller,
 )
-from mailbox import ensure_folder_path, folder_exists, list_folders, move_message
+from mailbox import (
+    close_pool,
+    ensure_folder_path,
+    folder_exists,
+    list_folders,
+    move_message,
+    move_messages,
+    warm_up_pool,
+)
 from scan_control import ScanStatus, controller as scan_controller
 from models import CalendarEventEntry, Suggestion
-from pending import PendingMail, PendingOverview, load_pending_overview
+from pending import PendingMail, PendingOverview, get_pending_overview
+from pending_stream import SseClient, hub as pending_hub
 from tags import TagSuggestion, load_tag_suggestions
 from ollama_service import (
+    STATUS_MAX_AGE_SECONDS,
     OllamaModelStatus,
     OllamaStatus,
     delete_model,
     ensure_ollama_ready,
     get_status,
     start_model_pull,
-    status_as_dict,
 )
-from keyword_filters import get_filter_config as load_keyword_filter_config
-from keyword_filters import get_filter_rules, update_filter_config as store_keyword_filters
+from keyword_filters import KeywordFilterRule
+from keyword_filters import filter_config_mtime_ns, get_filter_rules, update_filter_config as store_keyword_filters
 from settings import S
 from calendar_sync import (
     CalendarImportError,
@@ -121,7 +141,7 @@ class MoveRequest(BaseModel):
 
 
 class DecisionRequest(MoveRequest):
-    decision: str = Field("accept", pattern=r"^(accept|reject)$")
+    decision: Literal["accept", "reject"] = "accept"
 
 
 class BulkMoveRequest(BaseModel):
@@ -129,7 +149,7 @@ class BulkMoveRequest(BaseModel):
 
 
 class KeywordFilterMatchModel(BaseModel):
-    mode: Literal["all", "any"] = Field("all", pattern=r"^(all|any)$")
+    mode: Literal["all", "any"] = "all"
     fields: List[Literal["subject", "sender", "body"]] = Field(
         default_factory=lambda: ["subject", "sender", "body"]
     )
@@ -189,18 +209,12 @@ class KeywordFilterActivityResponse(BaseModel):
 
 
 def _clean_terms(values: Sequence[str]) -> List[str]:
-    seen: set[str] = set()
-    ordered: List[str] = []
-    for value in values:
-        cleaned = str(value).strip()
-        if not cleaned or cleaned in seen:
-            continue
-        seen.add(cleaned)
-        ordered.append(cleaned)
-    return ordered
+    return list(dict.fromkeys(cleaned for value in values if (cleaned := str(value).strip())))
 
 
-def _parse_datetime(value: str | None) -> Optional[datetime]:
+def _parse_datetime(value: datetime | str | None) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value
     if not value:
         return None
     try:
@@ -212,54 +226,75 @@ def _parse_datetime(value: str | None) -> Optional[datetime]:
 def _normalize_calendar_folders(folders: Sequence[str] | None) -> List[str]:
     if not folders:
         return []
-    normalized: List[str] = []
-    seen: set[str] = set()
-    for folder in folders:
-        value = str(folder or "").strip()
-        if not value or value in seen:
-            continue
-        seen.add(value)
-        normalized.append(value)
-    return normalized
-
-
-def _keyword_config_response() -> KeywordFilterConfigResponse:
-    raw = load_keyword_filter_config()
-    entries = raw.get("rules", [])
-    rules: List[KeywordFilterRuleModel] = []
-    if isinstance(entries, list):
-        for entry in entries:
-            if not isinstance(entry, dict):
-                continue
-            name = str(entry.get("name") or "").strip()
-            target_folder = str(entry.get("target_folder") or "").strip()
-            if not name or not target_folder:
-                continue
-            description_raw = entry.get("description")
-            description = str(description_raw).strip() if description_raw else None
-            try:
-                match_model = KeywordFilterMatchModel.model_validate(entry.get("match") or {})
-            except Exception:
-                match_model = KeywordFilterMatchModel()
-            match_model.terms = _clean_terms(match_model.terms)
-            date_model: Optional[KeywordFilterDateModel] = None
-            if isinstance(entry.get("date"), dict):
-                try:
-                    date_model = KeywordFilterDateModel.model_validate(entry.get("date"))
-                except Exception:
-                    date_model = None
-            rule = KeywordFilterRuleModel(
-                name=name,
-                description=description,
-                enabled=bool(entry.get("enabled", True)),
-                target_folder=target_folder,
-                tags=_clean_terms(entry.get("tags") or []),
-                match=match_model,
+    return list(dict.fromkeys(value for folder in folders if (value := str(folder or "").strip())))
+
+
+_keyword_config_lock = threading.Lock()
+_keyword_config_cache: Tuple[int, Tuple[KeywordFilterRule, ...], KeywordFilterConfigResponse, bytes] | None = None
+
+
+def _cached_keyword_config() -> Tuple[KeywordFilterConfigResponse, bytes]:
+    """Return the filter configuration and its JSON body, rebuilt only after the rules change.
+
+    ``keyword_filters`` reparses the rules whenever the file's mtime moves and drops them
+    on every write, so the mtime together with the tuple's identity serves as the cache key.
+    """
+
+    global _keyword_config_cache
+    mtime_ns = filter_config_mtime_ns()
+    rules = get_filter_rules()
+    with _keyword_config_lock:
+        cached = _keyword_config_cache
+    if cached is not None and cached[0] == mtime_ns and cached[1] is rules:
+        return cached[2], cached[3]
+    response = _build_keyword_config_response(rules)
+    body = response.model_dump_json().encode()
+    with _keyword_config_lock:
+        _keyword_config_cache = (mtime_ns, rules, response, body)
+    return response, body
+
+
+def _fresh_keyword_config_body() -> bytes | None:
+    """Return the cached filter body after a single ``stat``, or ``None`` if it needs rebuilding."""
+
+    with _keyword_config_lock:
+        cached = _keyword_config_cache
+    return cached[3] if cached is not None and cached[0] == filter_config_mtime_ns() else None
+
+
+def _build_keyword_config_response(rules: Sequence[KeywordFilterRule]) -> KeywordFilterConfigResponse:
+    """Map the parsed rules onto the response models.
+
+    ``get_filter_rules`` already cleaned and normalised every field, so the models are
+    constructed without another validation pass.
+    """
+
+    models: List[KeywordFilterRuleModel] = []
+    for rule in rules:
+        date_model: Optional[KeywordFilterDateModel] = None
+        if rule.date_after or rule.date_before or rule.include_future_dates:
+            date_model = KeywordFilterDateModel.model_construct(
+                after=rule.date_after,
+                before=rule.date_before,
+                include_future=rule.include_future_dates,
+            )
+        models.append(
+            KeywordFilterRuleModel.model_construct(
+                name=rule.name,
+                description=rule.description,
+                enabled=rule.enabled,
+                target_folder=rule.target_folder,
+                tags=list(rule.tags),
+                match=KeywordFilterMatchModel.model_construct(
+                    mode=rule.match.mode,
+                    fields=list(rule.match.fields),
+                    terms=list(rule.match.terms),
+                ),
                 date=date_model,
-                tag_future_dates=bool(entry.get("tag_future_dates")),
+                tag_future_dates=rule.tag_future_dates,
             )
-            rules.append(rule)
-    return KeywordFilterConfigResponse(rules=rules)
+        )
+    return KeywordFilterConfigResponse.model_construct(rules=models)
 
 
 def _serialise_filter_rule(rule: KeywordFilterRuleModel) -> Dict[str, Any]:
@@ -292,20 +327,23 @@ def _keyword_activity_response() -> KeywordFilterActivityResponse:
     summary = filter_activity_summary()
     rule_tags = {rule.name: list(rule.tags) for rule in get_filter_rules()}
 
-    rules = [
-        KeywordFilterActivityRule(
-            name=str(entry.get("name")),
-            target_folder=str(entry.get("target_folder")),
-            count=int(entry.get("count", 0)),
-            last_match=_parse_datetime(entry.get("last_match")),
-            tags=rule_tags.get(str(entry.get("name")), []),
+    rules: List[KeywordFilterActivityRule] = []
+    for entry in summary.get("rules", []):
+        if not isinstance(entry, dict):
+            continue
+        name = str(entry.get("name"))
+        rules.append(
+            KeywordFilterActivityRule.model_construct(
+                name=name,
+                target_folder=str(entry.get("target_folder")),
+                count=int(entry.get("count", 0)),
+                last_match=_parse_datetime(entry.get("last_match")),
+                tags=rule_tags.get(name, []),
+            )
         )
-        for entry in summary.get("rules", [])
-        if isinstance(entry, dict)
-    ]
 
     recent = [
-        KeywordFilterRecentEntry(
+        KeywordFilterRecentEntry.model_construct(
             message_uid=str(entry.get("message_uid")),
             rule_name=str(entry.get("rule_name")),
             src_folder=entry.get("src_folder"),
@@ -319,7 +357,7 @@ def _keyword_activity_response() -> KeywordFilterActivityResponse:
         if isinstance(entry, dict)
     ]
 
-    return KeywordFilterActivityResponse(
+    return KeywordFilterActivityResponse.model_construct(
         total_hits=int(summary.get("total_hits", 0)),
         hits_last_24h=int(summary.get("hits_last_24h", 0)),
         window_days=int(summary.get("window_days", 0)),
@@ -378,7 +416,7 @@ class ScanStatusResponse(BaseModel):
         rescan_status: RescanStatus | None = None,
     ) -> "ScanStatusResponse":
         rescan = rescan_status or RescanStatus()
-        return cls(
+        return cls.model_construct(
             active=status.active,
             folders=list(status.folders),
             poll_interval=float(status.poll_interval),
@@ -431,6 +469,25 @@ class OllamaModelStatusResponse(BaseModel):
     status: str | None = None
     error: str | None = None
 
+    @classmethod
+    def from_domain(cls, model: OllamaModelStatus) -> "OllamaModelStatusResponse":
+        return cls.model_construct(
+            name=model.name,
+            normalized_name=model.normalized_name,
+            purpose=model.purpose,
+            available=model.available,
+            pulled=model.pulled,
+            digest=model.digest,
+            size=model.size,
+            message=model.message,
+            pulling=model.pulling,
+            progress=model.progress,
+            download_total=model.download_total,
+            download_completed=model.download_completed,
+            status=model.status,
+            error=model.error,
+        )
+
 
 class OllamaStatusResponse(BaseModel):
     host: str
@@ -439,10 +496,20 @@ class OllamaStatusResponse(BaseModel):
     last_checked: datetime | None = None
     models: List[OllamaModelStatusResponse] = Field(default_factory=list)
 
+    @classmethod
+    def from_domain(cls, status: OllamaStatus) -> "OllamaStatusResponse":
+        return cls.model_construct(
+            host=status.host,
+            reachable=status.reachable,
+            message=status.message,
+            last_checked=status.last_checked,
+            models=[OllamaModelStatusResponse.from_domain(model) for model in status.models],
+        )
+
 
 class OllamaPullRequest(BaseModel):
     model: str = Field(..., min_length=1)
-    purpose: str | None = Field(default=None, pattern=r"^(classifier|embedding|custom)?$")
+    purpose: Literal["classifier", "embedding", "custom", ""] | None = None
 
 
 class OllamaDeleteRequest(BaseModel):
@@ -470,9 +537,18 @@ def _normalise_model_name(name: str) -> str:
 
 
 def _fallback_ollama_status(message: str, *, include_models: bool = True) -> OllamaStatus:
-    models: List[OllamaModelStatus] = []
-    if include_models:
-        models = [
+    models = tuple(_required_ollama_models()) if include_models else ()
+    return _build_fallback_ollama_status(message, models)
+
+
+@lru_cache(maxsize=16)
+def _build_fallback_ollama_status(message: str, models: Tuple[Tuple[str, str], ...]) -> OllamaStatus:
+    # One instance per message and model set keeps ``last_checked`` and thus the ETags of
+    # /api/ollama and /api/config stable while the fallback applies.
+    return OllamaStatus(
+        host=S.OLLAMA_HOST,
+        reachable=False,
+        models=[
             OllamaModelStatus(
                 name=model,
                 normalized_name=_normalise_model_name(model),
@@ -480,34 +556,20 @@ def _fallback_ollama_status(message: str, *, include_models: bool = True) -> Oll
                 available=False,
                 message=message,
             )
-            for model, purpose in _required_ollama_models()
-        ]
-    return OllamaStatus(host=S.OLLAMA_HOST, reachable=False, models=models, message=message)
+            for model, purpose in models
+        ],
+        message=message,
+    )
 
 
-async def _load_ollama_status(force_refresh: bool) -> OllamaStatus:
+async def _load_ollama_status(force_refresh: bool, max_age: float | None = None) -> OllamaStatus:
     try:
-        return await get_status(force_refresh=force_refresh)
+        return await get_status(force_refresh=force_refresh, max_age=max_age)
     except Exception as exc:  # pragma: no cover - defensive guard
         logger.exception("Ollama-Status konnte nicht geladen werden", exc_info=True)
         return _fallback_ollama_status(f"Ollama-Status nicht verfügbar: {exc}")
 
 
-class ConfigResponse(BaseModel):
-    dev_mode: bool
-    pending_list_limit: int
-    mode: MoveMode
-    analysis_module: AnalysisModule
-    classifier_model: str
-    protected_tag: str | None = None
-    processed_tag: str | None = None
-    ai_tag_prefix: str | None = None
-    ollama: OllamaStatusResponse | None = None
-    folder_templates: List["FolderTemplateConfig"] = Field(default_factory=list)
-    tag_slots: List["TagSlotConfig"] = Field(default_factory=list)
-    context_tags: List["ContextTagConfig"] = Field(default_factory=list)
-
-
 class ConfigUpdateRequest(BaseModel):
     mode: Optional[MoveMode] = None
     analysis_module: Optional[AnalysisModule] = None
@@ -517,21 +579,28 @@ class ConfigUpdateRequest(BaseModel):
     ai_tag_prefix: Optional[str] = None
 
 
-class FolderChildConfig(BaseModel):
-    name: str = Field(..., min_length=1)
-    description: str | None = None
-    children: List["FolderChildConfig"] = Field(default_factory=list)
-    tag_guidelines: List["TagGuidelineConfig"] = Field(default_factory=list)
+def _blank_to_none(value: str | None) -> str | None:
+    return value or None
+
+
+OptionalDescription = Annotated[str | None, AfterValidator(_blank_to_none)]
 
 
 class TagGuidelineConfig(BaseModel):
     name: str = Field(..., min_length=1)
-    description: str | None = None
+    description: OptionalDescription = None
+
+
+class FolderChildConfig(BaseModel):
+    name: str = Field(..., min_length=1)
+    description: OptionalDescription = None
+    children: List["FolderChildConfig"] = Field(default_factory=list)
+    tag_guidelines: List[TagGuidelineConfig] = Field(default_factory=list)
 
 
 class FolderTemplateConfig(BaseModel):
     name: str = Field(..., min_length=1)
-    description: str | None = None
+    description: OptionalDescription = None
     children: List[FolderChildConfig] = Field(default_factory=list)
     tag_guidelines: List[TagGuidelineConfig] = Field(default_factory=list)
 
@@ -549,7 +618,19 @@ class ContextTagConfig(BaseModel):
     folder: str
 
 
-ConfigResponse.model_rebuild()
+class ConfigResponse(BaseModel):
+    dev_mode: bool
+    pending_list_limit: int
+    mode: MoveMode
+    analysis_module: AnalysisModule
+    classifier_model: str
+    protected_tag: str | None = None
+    processed_tag: str | None = None
+    ai_tag_prefix: str | None = None
+    ollama: OllamaStatusResponse | None = None
+    folder_templates: List[FolderTemplateConfig] = Field(default_factory=list)
+    tag_slots: List[TagSlotConfig] = Field(default_factory=list)
+    context_tags: List[ContextTagConfig] = Field(default_factory=list)
 
 
 class CatalogResponse(BaseModel):
@@ -566,71 +647,38 @@ class CatalogSyncResponse(CatalogResponse):
     created_folders: List[str] = Field(default_factory=list)
 
 
-FolderChildConfig.model_rebuild()
-FolderTemplateConfig.model_rebuild()
-CatalogResponse.model_rebuild()
-CatalogSyncResponse.model_rebuild()
+# Reads the frozen configuration dataclasses directly; nested templates are walked by pydantic-core.
+_TEMPLATE_CONFIGS_ADAPTER: TypeAdapter[List[FolderTemplateConfig]] = TypeAdapter(List[FolderTemplateConfig])
 
 
-def _child_to_config(child: Any) -> FolderChildConfig:
-    return FolderChildConfig(
-        name=str(getattr(child, "name", "")).strip(),
-        description=(getattr(child, "description", None) or None),
-        children=[_child_to_config(grand) for grand in getattr(child, "children", []) or []],
-        tag_guidelines=[
-            TagGuidelineConfig(
-                name=str(getattr(guideline, "name", "")).strip(),
-                description=(getattr(guideline, "description", None) or None),
-            )
-            for guideline in getattr(child, "tag_guidelines", []) or []
-        ],
-    )
-
-
-def _template_to_config(template: Any) -> FolderTemplateConfig:
-    return FolderTemplateConfig(
-        name=str(getattr(template, "name", "")).strip(),
-        description=(getattr(template, "description", None) or None),
-        children=[_child_to_config(child) for child in getattr(template, "children", []) or []],
-        tag_guidelines=[
-            TagGuidelineConfig(
-                name=str(getattr(guideline, "name", "")).strip(),
-                description=(getattr(guideline, "description", None) or None),
-            )
-            for guideline in getattr(template, "tag_guidelines", []) or []
-        ],
-    )
-
-
-def _serialise_child(child: FolderChildConfig) -> Dict[str, Any]:
-    description = (child.description or "").strip()
+def _serialise_node(node: FolderChildConfig | FolderTemplateConfig) -> Dict[str, Any]:
     return {
-        "name": child.name.strip(),
-        "description": description,
-        "children": [_serialise_child(grand) for grand in child.children],
+        "name": node.name.strip(),
+        "description": (node.description or "").strip(),
+        "children": [],
         "tag_guidelines": [
             {
                 "name": guideline.name.strip(),
                 "description": (guideline.description or "").strip(),
             }
-            for guideline in child.tag_guidelines
+            for guideline in node.tag_guidelines
         ],
     }
 
 
 def _serialise_template(template: FolderTemplateConfig) -> Dict[str, Any]:
-    return {
-        "name": template.name.strip(),
-        "description": (template.description or "").strip(),
-        "children": [_serialise_child(child) for child in template.children],
-        "tag_guidelines": [
-            {
-                "name": guideline.name.strip(),
-                "description": (guideline.description or "").strip(),
-            }
-            for guideline in template.tag_guidelines
-        ],
-    }
+    root = _serialise_node(template)
+    # Walk the tree with an explicit stack; children are pushed in reverse so that each
+    # ``children`` list is filled in its original order.
+    stack: List[Tuple[FolderChildConfig, List[Dict[str, Any]]]] = [
+        (child, root["children"]) for child in reversed(template.children)
+    ]
+    while stack:
+        child, siblings = stack.pop()
+        entry = _serialise_node(child)
+        siblings.append(entry)
+        stack.extend((grand, entry["children"]) for grand in reversed(child.children))
+    return root
 
 
 def _serialise_tag_slot(slot: TagSlotConfig) -> Dict[str, Any]:
@@ -649,59 +697,92 @@ def _paths_to_template_payloads(paths: Sequence[str]) -> List[Dict[str, Any]]:
     for raw in paths:
         if not isinstance(raw, str):
             continue
-        normalized = raw.strip().strip("/")
-        if not normalized:
-            continue
-        segments = [segment.strip() for segment in normalized.split("/") if segment.strip()]
-        if not segments:
-            continue
         node = tree
-        for segment in segments:
-            node = node.setdefault(segment, {})
+        for segment in raw.split("/"):
+            if name := segment.strip():
+                node = node.setdefault(name, {})
 
-    def _build(name: str, children: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "name": name,
-            "description": "",
-            "children": [_build(child_name, child_children) for child_name, child_children in sorted(children.items())],
-            "tag_guidelines": [],
-        }
-
-    return [_build(name, children) for name, children in sorted(tree.items())]
+    payloads: List[Dict[str, Any]] = []
+    stack: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]] = [(tree, payloads)]
+    while stack:
+        children, output = stack.pop()
+        for name in sorted(children):
+            payload: Dict[str, Any] = {"name": name, "description": "", "children": [], "tag_guidelines": []}
+            output.append(payload)
+            stack.append((children[name], payload["children"]))
+    return payloads
 
 
 def _collect_template_paths(templates: Sequence[FolderTemplateConfig]) -> List[str]:
+    # Sibling folders may share a name, so paths are de-duplicated in first-seen order.
     seen: Dict[str, None] = {}
-    paths: List[str] = []
-
-    def _walk(node: FolderChildConfig | FolderTemplateConfig, prefix: str) -> None:
+    stack: List[Tuple[FolderChildConfig | FolderTemplateConfig, str]] = [
+        (template, "") for template in reversed(templates)
+    ]
+    while stack:
+        node, prefix = stack.pop()
         name = node.name.strip()
         if not name:
-            return
+            continue
         current = f"{prefix}/{name}" if prefix else name
-        if current not in seen:
-            seen[current] = None
-            paths.append(current)
-        for child in getattr(node, "children", []) or []:
-            _walk(child, current)
+        seen.setdefault(current, None)
+        stack.extend((child, current) for child in reversed(node.children))
+    return list(seen)
+
+
+_catalog_lock = threading.Lock()
+_catalog_cache: Tuple[List[FolderTemplate], List[TagSlot], CatalogResponse, bytes] | None = None
+
+
+def _build_catalog_response(templates: List[FolderTemplate], slots: List[TagSlot]) -> CatalogResponse:
+    return CatalogResponse.model_construct(
+        folder_templates=_TEMPLATE_CONFIGS_ADAPTER.validate_python(templates, from_attributes=True),
+        tag_slots=[
+            TagSlotConfig.model_construct(
+                name=slot.name,
+                description=slot.description or None,
+                options=list(slot.options),
+                aliases=list(slot.aliases),
+            )
+            for slot in slots
+        ],
+    )
+
+
+def _cached_catalog() -> Tuple[CatalogResponse, bytes]:
+    """Return the catalog response and its JSON body, rebuilt only after catalog changes.
 
-    for template in templates:
-        _walk(template, "")
-    return paths
+    ``configuration`` caches the parsed catalog and replaces those lists whenever the
+    catalog is written, so their identity doubles as the cache key.
+    """
+
+    global _catalog_cache
+    templates, slots = get_folder_templates(), get_tag_slots()
+    with _catalog_lock:
+        cached = _catalog_cache
+    if cached is not None and cached[0] is templates and cached[1] is slots:
+        return cached[2], cached[3]
+    response = _build_catalog_response(templates, slots)
+    body = response.model_dump_json().encode()
+    with _catalog_lock:
+        _catalog_cache = (templates, slots, response, body)
+    return response, body
+
+
+def _fresh_catalog_body() -> bytes | None:
+    """Return the cached catalog body without touching the file, or ``None`` if it needs rebuilding."""
+
+    if not (get_folder_templates.cache_info().currsize and get_tag_slots.cache_info().currsize):
+        return None
+    with _catalog_lock:
+        cached = _catalog_cache
+    if cached is not None and cached[0] is get_folder_templates() and cached[1] is get_tag_slots():
+        return cached[3]
+    return None
 
 
 def _catalog_response() -> CatalogResponse:
-    templates = [_template_to_config(template) for template in get_folder_templates()]
-    slots = [
-        TagSlotConfig(
-            name=slot.name,
-            description=slot.description or None,
-            options=list(slot.options),
-            aliases=list(slot.aliases),
-        )
-        for slot in get_tag_slots()
-    ]
-    return CatalogResponse(folder_templates=templates, tag_slots=slots)
+    return _cached_catalog()[0]
 
 
 class TagExampleResponse(BaseModel):
@@ -720,11 +801,11 @@ class TagSuggestionResponse(BaseModel):
 
     @classmethod
     def from_domain(cls, suggestion: TagSuggestion) -> "TagSuggestionResponse":
-        return cls(
+        return cls.model_construct(
             tag=suggestion.tag,
             occurrences=suggestion.occurrences,
             last_seen=suggestion.last_seen,
-            examples=[TagExampleResponse(**example) for example in suggestion.serialisable_examples()],
+            examples=[TagExampleResponse.model_construct(**example) for example in suggestion.serialisable_examples()],
         )
 
 
@@ -737,7 +818,7 @@ class PendingMailResponse(BaseModel):
 
     @classmethod
     def from_domain(cls, item: PendingMail) -> "PendingMailResponse":
-        return cls(
+        return cls.model_construct(
             message_uid=item.message_uid,
             folder=item.folder,
             subject=item.subject,
@@ -758,7 +839,7 @@ class PendingOverviewResponse(BaseModel):
 
     @classmethod
     def from_domain(cls, overview: PendingOverview) -> "PendingOverviewResponse":
-        return cls(
+        return cls.model_construct(
             total_messages=overview.total_messages,
             processed_count=overview.processed_count,
             pending_count=overview.pending_count,
@@ -773,13 +854,14 @@ class PendingOverviewResponse(BaseModel):
 def _localize_datetime(value: datetime | None, tz: ZoneInfo) -> Optional[datetime]:
     if value is None:
         return None
-    dt = value
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-    return dt.astimezone(tz)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(tz)
 
 
+@lru_cache(maxsize=32)
 def _resolve_timezone(name: str) -> ZoneInfo:
+    # Cached per name, so an unknown zone is logged once rather than on every overview.
     candidate = (name or "").strip() or "Europe/Berlin"
     try:
         return ZoneInfo(candidate)
@@ -841,6 +923,9 @@ def _mailbox_settings_payload() -> MailboxSettingsResponse:
     )
 
 
+_CALENDAR_EVENT_STATUSES = frozenset({"pending", "imported", "failed"})
+
+
 class CalendarEventResponse(BaseModel):
     id: int
     message_uid: str
@@ -867,8 +952,8 @@ class CalendarEventResponse(BaseModel):
 
     @classmethod
     def from_entry(cls, entry: CalendarEventEntry, tz: ZoneInfo) -> "CalendarEventResponse":
-        status_value = entry.status if entry.status in {"pending", "imported", "failed"} else "pending"
-        return cls(
+        status_value = entry.status if entry.status in _CALENDAR_EVENT_STATUSES else "pending"
+        return cls.model_construct(
             id=entry.id or 0,
             message_uid=entry.message_uid,
             folder=entry.folder or resolve_mailbox_inbox(),
@@ -882,8 +967,8 @@ class CalendarEventResponse(BaseModel):
             location=entry.location,
             starts_at=entry.starts_at,
             ends_at=entry.ends_at,
-            local_starts_at=_localize_datetime(entry.starts_at, tz) if entry.starts_at else None,
-            local_ends_at=_localize_datetime(entry.ends_at, tz) if entry.ends_at else None,
+            local_starts_at=_localize_datetime(entry.starts_at, tz),
+            local_ends_at=_localize_datetime(entry.ends_at, tz),
             all_day=bool(entry.all_day),
             timezone=entry.timezone,
             method=entry.method,
@@ -919,7 +1004,7 @@ class CalendarScanSummaryResponse(BaseModel):
     def from_result(cls, result: CalendarScanResult | None) -> "CalendarScanSummaryResponse | None":
         if result is None:
             return None
-        return cls(
+        return cls.model_construct(
             scanned_messages=result.scanned_messages,
             processed_events=result.processed_events,
             created=result.created,
@@ -940,7 +1025,7 @@ class CalendarAutoScanStatusResponse(BaseModel):
     @classmethod
     def from_status(cls, status: CalendarAutoScanStatus) -> "CalendarAutoScanStatusResponse":
         summary = CalendarScanSummaryResponse.from_result(status.last_summary)
-        return cls(
+        return cls.model_construct(
             active=bool(status.active),
             folders=list(status.folders),
             poll_interval=status.poll_interval,
@@ -964,7 +1049,7 @@ class CalendarManualScanStatusResponse(BaseModel):
     def from_status(cls, status: object) -> "CalendarManualScanStatusResponse":
         folders = list(getattr(status, "folders", []))
         summary = CalendarScanSummaryResponse.from_result(getattr(status, "last_summary", None))
-        return cls(
+        return cls.model_construct(
             active=bool(getattr(status, "active", False)),
             folders=folders,
             started_at=getattr(status, "started_at", None),
@@ -983,7 +1068,7 @@ class CalendarScanStatusResponse(BaseModel):
     def from_sources(
         cls, auto_status: CalendarAutoScanStatus, manual_status: object
     ) -> "CalendarScanStatusResponse":
-        return cls(
+        return cls.model_construct(
             auto=CalendarAutoScanStatusResponse.from_status(auto_status),
             manual=CalendarManualScanStatusResponse.from_status(manual_status),
         )
@@ -1103,22 +1188,82 @@ class CalendarConnectionTestResponse(BaseModel):
     ok: bool
     message: Optional[str] = None
 
-app = FastAPI(title="IMAP Smart Sorter")
-app.add_middleware(
-    CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"]
-)
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    init_db()
+    await asyncio.to_thread(suggestion_status_counts)
+    try:
+        _resolve_mode()
+    except HTTPException as exc:  # pragma: no cover - defensive startup guard
+        logger.warning("Gespeicherter Move-Modus ungültig: %s", exc.detail)
+    asyncio.get_running_loop().run_in_executor(None, warm_up_pool)
+    app.state.ollama_ready = asyncio.create_task(_initial_ollama_check()) if analysis_module_uses_llm() else None
+    try:
+        yield
+    finally:
+        await asyncio.to_thread(close_pool)
+
+
+app = FastAPI(title="IMAP Smart Sorter", default_response_class=ORJSONResponse, lifespan=_lifespan)
+# Same-origin deployments set CORS_ORIGINS empty and skip the middleware entirely.
+_cors_origins = [origin.strip() for origin in S.CORS_ORIGINS.split(",") if origin.strip()]
+if _cors_origins:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=_cors_origins,
+        allow_methods=["GET", "POST", "PUT"],
+        allow_headers=["Content-Type", "If-None-Match"],
+    )
 
 logger = logging.getLogger(__name__)
 
+_imap_slots = asyncio.Semaphore(max(int(S.IMAP_POOL_SIZE), 1))
 
-@app.on_event("startup")
-async def _startup() -> None:
-    init_db()
-    if analysis_module_uses_llm():
-        try:
-            await ensure_ollama_ready()
-        except Exception as exc:  # pragma: no cover - defensive startup guard
-            logger.warning("Initialer Ollama-Check fehlgeschlagen: %s", exc, exc_info=True)
+_TAGS_ADAPTER: TypeAdapter[List[TagSuggestionResponse]] = TypeAdapter(List[TagSuggestionResponse])
+_SUGGESTIONS_ADAPTER: TypeAdapter[SuggestionsResponse] = TypeAdapter(SuggestionsResponse)
+_SUGGESTION_ADAPTER: TypeAdapter[Suggestion] = TypeAdapter(Suggestion)
+_PENDING_ADAPTER: TypeAdapter[PendingOverviewResponse] = TypeAdapter(PendingOverviewResponse)
+_CONFIG_ADAPTER: TypeAdapter[ConfigResponse] = TypeAdapter(ConfigResponse)
+_MODE_ADAPTER: TypeAdapter[ModeResponse] = TypeAdapter(ModeResponse)
+_SCAN_STATUS_ADAPTER: TypeAdapter[ScanStatusResponse] = TypeAdapter(ScanStatusResponse)
+_CALENDAR_SCAN_STATUS_ADAPTER: TypeAdapter[CalendarScanStatusResponse] = TypeAdapter(CalendarScanStatusResponse)
+_OLLAMA_ADAPTER: TypeAdapter[OllamaStatusResponse] = TypeAdapter(OllamaStatusResponse)
+_KEYWORD_ACTIVITY_ADAPTER: TypeAdapter[KeywordFilterActivityResponse] = TypeAdapter(KeywordFilterActivityResponse)
+
+
+def _adapter_response(adapter: TypeAdapter[Any], value: Any, request: Request | None = None) -> Response:
+    """Serialise ``value`` with a prebuilt adapter, bypassing response_model re-validation."""
+
+    return _json_response(adapter.dump_json(value), request)
+
+
+def _json_response(body: bytes, request: Request | None = None, etag_source: bytes | None = None) -> Response:
+    """Return a JSON body; with ``request`` given, tag it with an ETag and honour If-None-Match.
+
+    ``etag_source`` overrides the bytes hashed for the ETag when the body carries volatile fields.
+    """
+
+    if request is None:
+        return Response(body, media_type="application/json")
+    etag = f'"{hashlib.blake2b(body if etag_source is None else etag_source, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    candidates = {tag.strip().removeprefix("W/") for tag in request.headers.get("if-none-match", "").split(",")}
+    if etag in candidates or "*" in candidates:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+async def _initial_ollama_check() -> None:
+    try:
+        await ensure_ollama_ready()
+    except Exception as exc:  # pragma: no cover - defensive startup guard
+        logger.warning("Initialer Ollama-Check fehlgeschlagen: %s", exc, exc_info=True)
+
+
+def _ollama_probe_pending() -> bool:
+    task: asyncio.Task[None] | None = getattr(app.state, "ollama_ready", None)
+    return task is not None and not task.done()
 
 
 @app.get("/healthz")
@@ -1126,40 +1271,72 @@ def healthcheck() -> Dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/readyz")
+async def readiness() -> Dict[str, str]:
+    if _ollama_probe_pending():
+        raise HTTPException(503, "Ollama-Check läuft noch")
+    return {"status": "ready"}
+
+
+_mode_lock = threading.Lock()
+_mode_cache: MoveMode | None = None
+
+
 def _resolve_mode() -> MoveMode:
-    stored = resolve_move_mode()
-    try:
-        return MoveMode(stored)
-    except ValueError as exc:  # pragma: no cover - defensive guard
-        raise HTTPException(500, f"invalid persisted mode: {stored}") from exc
+    """Return the move mode; it is read from the database once and kept in memory."""
+
+    global _mode_cache
+    cached = _mode_cache
+    if cached is not None:
+        return cached
+    with _mode_lock:
+        if _mode_cache is None:
+            stored = resolve_move_mode()
+            try:
+                _mode_cache = MoveMode(stored)
+            except ValueError as exc:  # pragma: no cover - defensive guard
+                raise HTTPException(500, f"invalid persisted mode: {stored}") from exc
+        return _mode_cache
+
+
+def _store_mode(mode: MoveMode) -> None:
+    global _mode_cache
+    with _mode_lock:
+        set_mode(mode.value)
+        _mode_cache = mode
 
 
 @app.get("/api/mode", response_model=ModeResponse)
-def api_get_mode() -> ModeResponse:
-    return ModeResponse(mode=_resolve_mode())
+async def api_get_mode() -> Response:
+    return _adapter_response(_MODE_ADAPTER, ModeResponse.model_construct(mode=_resolve_mode()))
 
 
 @app.post("/api/mode", response_model=ModeResponse)
-def api_set_mode(payload: ModeUpdate) -> ModeResponse:
-    set_mode(payload.mode.value)
-    return ModeResponse(mode=payload.mode)
+async def api_set_mode(payload: ModeUpdate) -> Response:
+    await asyncio.to_thread(_store_mode, payload.mode)
+    return _adapter_response(_MODE_ADAPTER, ModeResponse.model_construct(mode=payload.mode))
 
 
 @app.get("/api/folders", response_model=FolderSelectionResponse)
-def api_folders() -> FolderSelectionResponse:
-    available = list_folders()
-    selected = get_monitored_folders()
-    inbox = resolve_mailbox_inbox()
+async def api_folders(request: Request) -> Response:
+    available, selected, inbox = await asyncio.gather(
+        asyncio.to_thread(list_folders),
+        asyncio.to_thread(get_monitored_folders),
+        asyncio.to_thread(resolve_mailbox_inbox),
+    )
     if not selected and inbox in available:
         selected = [inbox]
-    return FolderSelectionResponse(available=available, selected=selected)
+    response = FolderSelectionResponse(available=available, selected=selected)
+    return _json_response(response.model_dump_json().encode(), request)
 
 
 @app.post("/api/folders/selection", response_model=FolderSelectionResponse)
-def api_update_folders(payload: FolderSelectionUpdate) -> FolderSelectionResponse:
-    set_monitored_folders(payload.folders)
-    available = list_folders()
-    selected = get_monitored_folders()
+async def api_update_folders(payload: FolderSelectionUpdate) -> FolderSelectionResponse:
+    await asyncio.to_thread(set_monitored_folders, payload.folders)
+    available, selected = await asyncio.gather(
+        asyncio.to_thread(list_folders),
+        asyncio.to_thread(get_monitored_folders),
+    )
     return FolderSelectionResponse(available=available, selected=selected)
 
 
@@ -1168,10 +1345,13 @@ async def api_create_folder(payload: FolderCreateRequest) -> FolderCreateRespons
     path = (payload.path or "").strip().strip("/")
     if not path:
         raise HTTPException(400, "folder path must not be empty")
-    if folder_exists(path):
+    async with _imap_slots:
+        exists = await asyncio.to_thread(folder_exists, path)
+    if exists:
         return FolderCreateResponse(created=path, existed=True)
     try:
-        created = ensure_folder_path(path)
+        async with _imap_slots:
+            created = await asyncio.to_thread(ensure_folder_path, path)
     except ValueError as exc:
         raise HTTPException(400, str(exc)) from exc
     except Exception as exc:  # pragma: no cover - network interaction
@@ -1180,14 +1360,22 @@ async def api_create_folder(payload: FolderCreateRequest) -> FolderCreateRespons
     return FolderCreateResponse(created=created, existed=False)
 
 
+async def _config_ollama_status(module_value: str) -> OllamaStatus:
+    if not analysis_module_uses_llm(module_value):
+        return _fallback_ollama_status("LLM deaktiviert (Statisches Modul)", include_models=False)
+    if _ollama_probe_pending():
+        return _fallback_ollama_status("Ollama-Status wird noch geprüft")
+    return await _load_ollama_status(force_refresh=False)
+
+
 async def _config_response() -> ConfigResponse:
     module_value = resolve_analysis_module()
-    if analysis_module_uses_llm(module_value):
-        status = await _load_ollama_status(force_refresh=False)
-    else:
-        status = _fallback_ollama_status("LLM deaktiviert (Statisches Modul)", include_models=False)
-    catalog = _catalog_response()
-    protected_tag, processed_tag, ai_tag_prefix = resolve_mailbox_tags()
+    status, catalog, (protected_tag, processed_tag, ai_tag_prefix), classifier_model = await asyncio.gather(
+        _config_ollama_status(module_value),
+        asyncio.to_thread(_catalog_response),
+        asyncio.to_thread(resolve_mailbox_tags),
+        asyncio.to_thread(resolve_classifier_model),
+    )
     context_tags = [
         ContextTagConfig(name=guideline.name, description=guideline.description or None, folder=guideline.folder)
         for guideline in get_context_tag_guidelines()
@@ -1197,11 +1385,11 @@ async def _config_response() -> ConfigResponse:
         pending_list_limit=max(int(getattr(S, "PENDING_LIST_LIMIT", 0)), 0),
         mode=_resolve_mode(),
         analysis_module=AnalysisModule(module_value),
-        classifier_model=resolve_classifier_model(),
+        classifier_model=classifier_model,
         protected_tag=protected_tag,
         processed_tag=processed_tag,
         ai_tag_prefix=ai_tag_prefix,
-        ollama=OllamaStatusResponse.model_validate(status_as_dict(status)),
+        ollama=OllamaStatusResponse.from_domain(status),
         folder_templates=catalog.folder_templates,
         tag_slots=catalog.tag_slots,
         context_tags=context_tags,
@@ -1209,17 +1397,17 @@ async def _config_response() -> ConfigResponse:
 
 
 @app.get("/api/config", response_model=ConfigResponse)
-async def api_config() -> ConfigResponse:
-    return await _config_response()
+async def api_config(request: Request) -> Response:
+    return _adapter_response(_CONFIG_ADAPTER, await _config_response(), request)
 
 
 @app.put("/api/config", response_model=ConfigResponse)
-async def api_update_config(payload: ConfigUpdateRequest) -> ConfigResponse:
+async def api_update_config(payload: ConfigUpdateRequest) -> Response:
     updates = payload.model_dump(exclude_unset=True)
     if "mode" in updates:
         if payload.mode is None:
             raise HTTPException(400, "mode must not be null")
-        set_mode(payload.mode.value)
+        await asyncio.to_thread(_store_mode, payload.mode)
     if "analysis_module" in updates:
         if payload.analysis_module is None:
             raise HTTPException(400, "analysis_module must not be null")
@@ -1235,51 +1423,45 @@ async def api_update_config(payload: ConfigUpdateRequest) -> ConfigResponse:
             updates.get("processed_tag"),
             updates.get("ai_tag_prefix"),
         )
-    return await _config_response()
+    return _adapter_response(_CONFIG_ADAPTER, await _config_response())
 
 
 @app.get("/api/catalog", response_model=CatalogResponse)
-def api_catalog_definition() -> CatalogResponse:
-    return _catalog_response()
+async def api_catalog_definition(request: Request) -> Response:
+    # Cache hits are answered on the loop; rebuilding reads and validates the file, so it runs in a thread.
+    body = _fresh_catalog_body()
+    if body is None:
+        body = (await asyncio.to_thread(_cached_catalog))[1]
+    return _json_response(body, request)
 
 
 @app.put("/api/catalog", response_model=CatalogResponse)
-def api_update_catalog_definition(payload: CatalogUpdateRequest) -> CatalogResponse:
+def api_update_catalog_definition(payload: CatalogUpdateRequest) -> Response:
     templates = [_serialise_template(template) for template in payload.folder_templates]
     slots = [_serialise_tag_slot(slot) for slot in payload.tag_slots]
     update_catalog(templates, slots)
-    return _catalog_response()
+    return _json_response(_cached_catalog()[1])
 
 
-def _segments_for_path(path: str) -> list[str]:
-    if "/" in path:
-        delimiter = "/"
-    elif "." in path:
-        delimiter = "."
-    else:
-        return [path]
-    return [segment for segment in path.split(delimiter) if segment.strip()]
+def _folder_tail(path: str) -> str:
+    """Return the last non-blank segment of ``path`` (split on ``/``, else on ``.``)."""
+
+    for delimiter in ("/", "."):
+        if delimiter in path:
+            return path.rstrip(f"{delimiter} ").rpartition(delimiter)[2].strip() or path
+    return path
 
 
 def _filter_default_folders(folders: list[str], exclude_defaults: Sequence[str]) -> list[str]:
-    if not exclude_defaults:
-        return folders
-    excluded = {value.strip().casefold() for value in exclude_defaults if value and str(value).strip()}
+    excluded = frozenset(value.strip().casefold() for value in exclude_defaults if value and str(value).strip())
     if not excluded:
         return folders
-    filtered: list[str] = []
-    for folder in folders:
-        tail_candidates = _segments_for_path(folder)
-        tail = tail_candidates[-1].casefold() if tail_candidates else folder.casefold()
-        if tail in excluded:
-            continue
-        filtered.append(folder)
-    return filtered
+    return [folder for folder in folders if _folder_tail(folder).casefold() not in excluded]
 
 
 @app.post("/api/catalog/import-mailbox", response_model=CatalogSyncResponse)
 def api_catalog_import_mailbox(payload: CatalogImportRequest = Body(default_factory=CatalogImportRequest)) -> CatalogSyncResponse:
-    folders = [str(folder).strip() for folder in list_folders() if str(folder).strip()]
+    folders = list(dict.fromkeys(name for folder in list_folders() if (name := str(folder).strip())))
     if not folders:
         raise HTTPException(404, "Es wurden keine IMAP-Ordner gefunden.")
     folders = _filter_default_folders(folders, payload.exclude_defaults)
@@ -1290,13 +1472,15 @@ def api_catalog_import_mailbox(payload: CatalogImportRequest = Body(default_fact
     tag_slots = current.get("tag_slots", []) if isinstance(current, dict) else []
     if not isinstance(tag_slots, list):
         tag_slots = []
-    update_catalog(templates_payload, tag_slots)
+    stored_templates = current.get("folder_templates") if isinstance(current, dict) else None
+    # Re-importing an unchanged mailbox keeps the catalog file and its cached views as they are.
+    if stored_templates != templates_payload:
+        update_catalog(templates_payload, tag_slots)
     catalog = _catalog_response()
-    imported = list(dict.fromkeys(folders))
-    return CatalogSyncResponse(
+    return CatalogSyncResponse.model_construct(
         folder_templates=catalog.folder_templates,
         tag_slots=catalog.tag_slots,
-        imported_folders=imported,
+        imported_folders=folders,
         created_folders=[],
     )
 
@@ -1316,7 +1500,7 @@ def api_catalog_export_mailbox() -> CatalogSyncResponse:
             raise HTTPException(500, f"could not create folder: {exc}") from exc
         created.append(created_path)
     unique_created = list(dict.fromkeys(created))
-    return CatalogSyncResponse(
+    return CatalogSyncResponse.model_construct(
         folder_templates=catalog.folder_templates,
         tag_slots=catalog.tag_slots,
         imported_folders=[],
@@ -1325,44 +1509,63 @@ def api_catalog_export_mailbox() -> CatalogSyncResponse:
 
 
 @app.get("/api/filters", response_model=KeywordFilterConfigResponse)
-def api_keyword_filters() -> KeywordFilterConfigResponse:
-    return _keyword_config_response()
+async def api_keyword_filters(request: Request) -> Response:
+    body = _fresh_keyword_config_body()
+    if body is None:
+        body = (await asyncio.to_thread(_cached_keyword_config))[1]
+    return _json_response(body, request)
 
 
 @app.put("/api/filters", response_model=KeywordFilterConfigResponse)
-def api_update_keyword_filters(payload: KeywordFilterConfigResponse) -> KeywordFilterConfigResponse:
+def api_update_keyword_filters(payload: KeywordFilterConfigResponse) -> Response:
     rules = [_serialise_filter_rule(rule) for rule in payload.rules]
     store_keyword_filters(rules)
-    return _keyword_config_response()
+    return _json_response(_cached_keyword_config()[1])
 
 
 @app.get("/api/filters/activity", response_model=KeywordFilterActivityResponse)
-def api_keyword_filter_activity() -> KeywordFilterActivityResponse:
-    return _keyword_activity_response()
+def api_keyword_filter_activity() -> Response:
+    return _adapter_response(_KEYWORD_ACTIVITY_ADAPTER, _keyword_activity_response())
 
 
 @app.get("/api/suggestions", response_model=SuggestionsResponse)
-def api_suggestions(include: str = Query("open", pattern=r"^(open|all)$")) -> SuggestionsResponse:
-    include_all = include == "all"
-    counts = suggestion_status_counts()
-    suggestions = list_suggestions(include_all)
-    return SuggestionsResponse(
+async def api_suggestions(request: Request, include: Literal["open", "all"] = "open") -> Response:
+    return await asyncio.to_thread(_suggestions_response, include == "all", request)
+
+
+def _suggestions_response(include_all: bool, request: Request) -> Response:
+    suggestions, counts = list_suggestions_with_counts(include_all)
+    response = SuggestionsResponse.model_construct(
         suggestions=suggestions,
         open_count=counts.get("open", 0),
         decided_count=counts.get("decided", 0),
         error_count=counts.get("error", 0),
         total_count=counts.get("total", 0),
     )
+    return _adapter_response(_SUGGESTIONS_ADAPTER, response, request)
+
+
+@app.get("/api/suggestions.ndjson")
+def api_suggestions_ndjson(include: Literal["open", "all"] = "open") -> StreamingResponse:
+    rows = iter_suggestions(include == "all")
+    return StreamingResponse(
+        (_SUGGESTION_ADAPTER.dump_json(row) + b"\n" for row in rows),
+        media_type="application/x-ndjson",
+    )
 
 
 @app.get("/api/ollama", response_model=OllamaStatusResponse)
-async def api_ollama_status() -> OllamaStatusResponse:
+async def api_ollama_status(request: Request) -> Response:
     module_value = resolve_analysis_module()
     if analysis_module_uses_llm(module_value):
-        status = await _load_ollama_status(force_refresh=True)
+        status = await _load_ollama_status(force_refresh=True, max_age=STATUS_MAX_AGE_SECONDS)
     else:
         status = _fallback_ollama_status("LLM deaktiviert (Statisches Modul)", include_models=False)
-    return OllamaStatusResponse.model_validate(status_as_dict(status))
+    value = OllamaStatusResponse.from_domain(status)
+    # Every probe stamps a new ``last_checked``; leave it out of the ETag so an unchanged
+    # status still answers pollers with 304.
+    etag_source = _OLLAMA_ADAPTER.dump_json(value, exclude={"last_checked"})
+    return _json_response(_OLLAMA_ADAPTER.dump_json(value), request, etag_source)
 
 
 @app.post("/api/ollama/pull", response_model=OllamaStatusResponse)
@@ -1376,9 +1579,9 @@ async def api_ollama_pull(payload: OllamaPullRequest) -> OllamaStatusResponse:
     except Exception as exc:  # pragma: no cover - defensive guard
         logger.exception("Start des Ollama-Pulls fehlgeschlagen", exc_info=True)
         status = _fallback_ollama_status(f"Modell-Download konnte nicht gestartet werden: {exc}")
-        return OllamaStatusResponse.model_validate(status_as_dict(status))
+        return OllamaStatusResponse.from_domain(status)
     status = await _load_ollama_status(force_refresh=True)
-    return OllamaStatusResponse.model_validate(status_as_dict(status))
+    return OllamaStatusResponse.from_domain(status)
 
 
 @app.post("/api/ollama/delete", response_model=OllamaStatusResponse)
@@ -1391,25 +1594,45 @@ async def api_ollama_delete(payload: OllamaDeleteRequest) -> OllamaStatusRespons
     except Exception as exc:  # pragma: no cover - defensive guard
         logger.exception("Löschen des Ollama-Modells fehlgeschlagen", exc_info=True)
         status = _fallback_ollama_status(f"Modell konnte nicht gelöscht werden: {exc}")
-        return OllamaStatusResponse.model_validate(status_as_dict(status))
+        return OllamaStatusResponse.from_domain(status)
     status = await _load_ollama_status(force_refresh=True)
-    return OllamaStatusResponse.model_validate(status_as_dict(status))
+    return OllamaStatusResponse.from_domain(status)
+
+
+async def _load_pending_overview(*, allow_stale: bool = False) -> PendingOverview:
+    folders = await asyncio.to_thread(get_monitored_folders)
+    return await get_pending_overview(folders, allow_stale=allow_stale)
+
+
+_pending_body_cache: Tuple[PendingOverview, bytes] | None = None
 
 
-async def _pending_overview() -> PendingOverviewResponse:
-    overview = await load_pending_overview(get_monitored_folders())
-    return PendingOverviewResponse.from_domain(overview)
+def _pending_body(overview: PendingOverview) -> bytes:
+    """Return the JSON body for ``overview``, encoding each overview only once.
+
+    ``get_pending_overview`` hands out the same object until it recomputes, so repeated
+    polls reuse the body and its ETag.
+    """
+
+    global _pending_body_cache
+    cached = _pending_body_cache
+    if cached is not None and cached[0] is overview:
+        return cached[1]
+    body = _PENDING_ADAPTER.dump_json(PendingOverviewResponse.from_domain(overview))
+    _pending_body_cache = (overview, body)
+    return body
 
 
 @app.get("/api/pending", response_model=PendingOverviewResponse)
-async def api_pending() -> PendingOverviewResponse:
-    return await _pending_overview()
+async def api_pending(request: Request) -> Response:
+    overview = await _load_pending_overview(allow_stale=True)
+    return _json_response(_pending_body(overview), request)
 
 
 @app.get("/api/tags", response_model=List[TagSuggestionResponse])
-def api_tags() -> List[TagSuggestionResponse]:
+def api_tags(request: Request) -> Response:
     suggestions = load_tag_suggestions()
-    return [TagSuggestionResponse.from_domain(item) for item in suggestions]
+    return _adapter_response(_TAGS_ADAPTER, [TagSuggestionResponse.from_domain(item) for item in suggestions], request)
 
 
 @app.get("/api/calendar/overview", response_model=CalendarOverviewResponse)
@@ -1418,11 +1641,12 @@ def api_calendar_overview() -> CalendarOverviewResponse:
 
 
 @app.get("/api/calendar/scan/status", response_model=CalendarScanStatusResponse)
-async def api_calendar_scan_status() -> CalendarScanStatusResponse:
-    return CalendarScanStatusResponse.from_sources(
+async def api_calendar_scan_status(request: Request) -> Response:
+    status = CalendarScanStatusResponse.from_sources(
         calendar_scan_controller.status,
         calendar_rescan_controller.status,
     )
+    return _adapter_response(_CALENDAR_SCAN_STATUS_ADAPTER, status, request)
 
 
 @app.post("/api/calendar/scan/start", response_model=CalendarScanStartResponse)
@@ -1662,48 +1886,81 @@ def _ensure_suggestion(uid: str) -> Suggestion:
 
 
 @app.post("/api/decide")
-def api_decide(payload: DecisionRequest) -> Dict[str, Any]:
-    suggestion = _ensure_suggestion(payload.message_uid)
-    updated = record_decision(payload.message_uid, payload.decision)
-
-    current_mode = _resolve_mode()
-    if payload.decision == "accept" and current_mode == MoveMode.CONFIRM:
-        move_payload = MoveRequest(
-            message_uid=payload.message_uid,
-            target_folder=payload.target_folder,
-            dry_run=payload.dry_run,
-        )
-        return api_move(move_payload)
-    payload_suggestion = updated.dict() if isinstance(updated, Suggestion) else suggestion.dict()
+async def api_decide(payload: DecisionRequest) -> Dict[str, Any]:
+    move_on_accept = payload.decision == "accept" and _resolve_mode() == MoveMode.CONFIRM
+    if move_on_accept and not payload.dry_run:
+        return await _decide_and_move(payload)
+
+    suggestion = await asyncio.to_thread(_ensure_suggestion, payload.message_uid)
+    if move_on_accept:
+        await asyncio.to_thread(record_decision, payload.message_uid, payload.decision, row=suggestion)
+        return await _do_move(suggestion, payload.target_folder, dry_run=True)
+
+    updated = await asyncio.to_thread(record_decision, payload.message_uid, payload.decision, row=suggestion)
+    payload_suggestion = (updated if isinstance(updated, Suggestion) else suggestion).model_dump(mode="json")
     return {"ok": True, "suggestion": payload_suggestion}
 
 
-def _perform_move(uid: str, target: str, src_folder: str | None) -> None:
+async def _decide_and_move(payload: DecisionRequest) -> Dict[str, Any]:
+    row = await asyncio.to_thread(_ensure_suggestion, payload.message_uid)
+    uid = row.message_uid
     try:
-        move_message(uid, target, src_folder=src_folder)
+        async with _imap_slots:
+            await asyncio.to_thread(move_message, uid, payload.target_folder, src_folder=row.src_folder)
     except Exception as exc:
-        mark_failed(uid, str(exc))
+        try:
+            await asyncio.to_thread(record_decided_move, uid, payload.decision, str(exc))
+        except Exception:  # pragma: no cover - database unavailable
+            logger.exception("Failed to record move failure for %s", uid)
         raise HTTPException(500, f"move failed: {exc}") from exc
-    mark_moved(uid)
+    try:
+        await asyncio.to_thread(record_decided_move, uid, payload.decision)
+    except Exception as exc:
+        logger.error("Moved %s but could not record the decision: %s", uid, exc)
+        raise HTTPException(500, f"message moved, but the decision could not be saved: {exc}") from exc
+    return {"ok": True, "dry_run": False}
 
 
-@app.post("/api/move")
-def api_move(payload: MoveRequest) -> Dict[str, Any]:
-    suggestion = _ensure_suggestion(payload.message_uid)
+async def _perform_move(uid: str, target: str, src_folder: str | None) -> None:
+    try:
+        async with _imap_slots:
+            await asyncio.to_thread(move_message, uid, target, src_folder=src_folder)
+    except Exception as exc:
+        await asyncio.to_thread(mark_failed, uid, str(exc))
+        raise HTTPException(500, f"move failed: {exc}") from exc
+    await asyncio.to_thread(mark_moved, uid)
 
-    dry_run = payload.dry_run or _resolve_mode() == MoveMode.DRY_RUN
+
+async def _target_exists(target: str) -> bool:
+    async with _imap_slots:
+        return await asyncio.to_thread(folder_exists, target)
+
+
+def _dry_run_result(exists: bool) -> Dict[str, Any]:
+    return {"ok": exists, "dry_run": True, "checks": {"folder_exists": exists}}
+
+
+async def _do_move(suggestion: Suggestion, target: str, dry_run: bool) -> Dict[str, Any]:
+    uid = suggestion.message_uid
     if dry_run:
-        exists = folder_exists(payload.target_folder)
-        record_dry_run(payload.message_uid, {"folder_exists": exists})
-        return {"ok": exists, "dry_run": True, "checks": {"folder_exists": exists}}
+        exists = await _target_exists(target)
+        await asyncio.to_thread(record_dry_run, uid, {"folder_exists": exists})
+        return _dry_run_result(exists)
 
-    _perform_move(payload.message_uid, payload.target_folder, suggestion.src_folder)
+    await _perform_move(uid, target, suggestion.src_folder)
     return {"ok": True, "dry_run": False}
 
 
+@app.post("/api/move")
+async def api_move(payload: MoveRequest) -> Dict[str, Any]:
+    suggestion = await asyncio.to_thread(_ensure_suggestion, payload.message_uid)
+    dry_run = payload.dry_run or _resolve_mode() == MoveMode.DRY_RUN
+    return await _do_move(suggestion, payload.target_folder, dry_run)
+
+
 @app.post("/api/proposal")
-def api_proposal(payload: ProposalDecisionRequest) -> Dict[str, Any]:
-    suggestion = _ensure_suggestion(payload.message_uid)
+async def api_proposal(payload: ProposalDecisionRequest) -> Dict[str, Any]:
+    suggestion = await asyncio.to_thread(_ensure_suggestion, payload.message_uid)
     if not suggestion.proposal:
         raise HTTPException(400, "no proposal available")
 
@@ -1717,48 +1974,152 @@ def api_proposal(payload: ProposalDecisionRequest) -> Dict[str, Any]:
         if not full_path:
             raise HTTPException(400, "invalid proposal data")
         try:
-            created = ensure_folder_path(full_path)
-            proposal["full_path"] = created
+            async with _imap_slots:
+                proposal["full_path"] = await asyncio.to_thread(ensure_folder_path, full_path)
         except ValueError as exc:
             raise HTTPException(400, str(exc)) from exc
         except Exception as exc:  # pragma: no cover - network interaction
             logger.error("Failed to create folder for proposal %s: %s", full_path, exc)
             raise HTTPException(500, f"could not create folder: {exc}") from exc
 
-    updated = update_proposal(payload.message_uid, proposal)
+    updated = await asyncio.to_thread(update_proposal, payload.message_uid, proposal)
     result = updated.proposal if updated else proposal
     return {"ok": True, "proposal": result}
 
 
+async def _move_group(src_folder: str | None, target: str, uids: List[str]) -> Dict[str, str | None]:
+    try:
+        async with _imap_slots:
+            return await asyncio.to_thread(move_messages, uids, target, src_folder=src_folder)
+    except Exception as exc:
+        logger.error("Bulk move of %s messages to %s failed: %s", len(uids), target, exc)
+        return {uid: str(exc) for uid in uids}
+
+
 @app.post("/api/move/bulk")
-def api_move_bulk(payload: BulkMoveRequest) -> Dict[str, List[Dict[str, Any]]]:
-    results = [api_move(item) for item in payload.items]
-    return {"results": results}
+async def api_move_bulk(payload: BulkMoveRequest) -> Dict[str, List[Dict[str, Any]]]:
+    results: List[Dict[str, Any] | None] = [None] * len(payload.items)
+    dry_run_indices: List[int] = []
+    groups: Dict[Tuple[str | None, str], List[int]] = {}
+    mode_dry_run = _resolve_mode() == MoveMode.DRY_RUN
+    rows = await asyncio.to_thread(find_suggestions_by_uids, [item.message_uid for item in payload.items])
+
+    for index, item in enumerate(payload.items):
+        suggestion = rows.get(item.message_uid)
+        if not suggestion:
+            results[index] = {"ok": False, "message_uid": item.message_uid, "error": "suggestion not found"}
+        elif item.dry_run or mode_dry_run:
+            dry_run_indices.append(index)
+        else:
+            groups.setdefault((suggestion.src_folder, item.target_folder), []).append(index)
+
+    # Dry runs only check the target folder, so items sharing a target share one check.
+    dry_run_targets = list(dict.fromkeys(payload.items[index].target_folder for index in dry_run_indices))
+    group_keys = list(groups)
+    outcomes = await asyncio.gather(
+        *(_target_exists(target) for target in dry_run_targets),
+        *(
+            _move_group(src, target, [payload.items[index].message_uid for index in groups[(src, target)]])
+            for src, target in group_keys
+        ),
+        return_exceptions=True,
+    )
+
+    checks = dict(zip(dry_run_targets, outcomes))
+    dry_runs: Dict[str, bool] = {}
+    for index in dry_run_indices:
+        item = payload.items[index]
+        outcome = checks[item.target_folder]
+        if isinstance(outcome, BaseException):
+            logger.error("Bulk move of %s failed: %s", item.message_uid, outcome)
+            results[index] = {"ok": False, "message_uid": item.message_uid, "error": str(outcome)}
+        else:
+            dry_runs[item.message_uid] = outcome
+            results[index] = _dry_run_result(outcome)
+
+    moved: List[str] = []
+    failed: Dict[str, str] = {}
+    for key, errors in zip(group_keys, outcomes[len(dry_run_targets):]):
+        for index in groups[key]:
+            uid = payload.items[index].message_uid
+            error = errors.get(uid) if isinstance(errors, dict) else str(errors)
+            if error is None:
+                moved.append(uid)
+                results[index] = {"ok": True, "dry_run": False}
+            else:
+                failed[uid] = error
+                results[index] = {"ok": False, "message_uid": uid, "error": f"move failed: {error}"}
+    await asyncio.to_thread(record_bulk_outcomes, moved, failed, dry_runs)
+
+    return {"results": [entry for entry in results if entry is not None]}
+
+
+async def _pending_stream_payload() -> Dict[str, Any]:
+    """Build the stream payload as plain JSON types, matching ``PendingOverviewResponse``.
+
+    The hub encodes it with orjson and diffs it against the previous payload, so no
+    pydantic models are needed on this path.
+    """
+
+    overview = await _load_pending_overview()
+    return {
+        "total_messages": overview.total_messages,
+        "processed_count": overview.processed_count,
+        "pending_count": overview.pending_count,
+        "pending_ratio": overview.pending_ratio,
+        "pending": [
+            {
+                "message_uid": item.message_uid,
+                "folder": item.folder,
+                "subject": item.subject,
+                "from_addr": item.from_addr,
+                "date": item.date,
+            }
+            for item in overview.pending
+        ],
+        "displayed_pending": overview.displayed_pending,
+        "list_limit": overview.list_limit,
+        "limit_active": overview.limit_active,
+    }
 
 
 @app.websocket("/ws/stream")
 async def ws_stream(ws: WebSocket) -> None:
     await ws.accept()
-    await ws.send_json({"type": "hello", "msg": "connected"})
-
     try:
+        await ws.send_json({"type": "hello", "msg": "connected"})
+        pending_hub.subscribe(ws, _pending_stream_payload)
         while True:
-            try:
-                snapshot = await _pending_overview()
-                await ws.send_json({"type": "pending_overview", "payload": snapshot.dict()})
-            except (WebSocketDisconnect, ClientDisconnected):
-                logger.debug("WebSocket client disconnected during stream")
-                break
-            except Exception as exc:  # pragma: no cover - network/IMAP interaction
-                logger.warning("Failed to stream pending overview: %s", exc)
-                try:
-                    await ws.send_json({"type": "pending_error", "error": str(exc)})
-                except (WebSocketDisconnect, ClientDisconnected):
-                    logger.debug("WebSocket client disconnected while reporting error")
-                    break
-            await asyncio.sleep(5)
-    except WebSocketDisconnect:
+            await ws.receive_text()
+    except (WebSocketDisconnect, ClientDisconnected):
         logger.debug("WebSocket client disconnected")
+    finally:
+        pending_hub.unsubscribe(ws)
+
+
+_SSE_HELLO = b'data: {"type":"hello","msg":"connected"}\n\n'
+
+
+@app.get("/api/pending/stream")
+async def api_pending_stream() -> StreamingResponse:
+    """Server-Sent-Events variant of ``/ws/stream`` for clients that only need to listen."""
+
+    client = SseClient()
+
+    async def events() -> AsyncIterator[bytes]:
+        pending_hub.subscribe(client, _pending_stream_payload)
+        try:
+            yield _SSE_HELLO
+            async for event in client.events():
+                yield event.encode()
+        finally:
+            pending_hub.unsubscribe(client)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @app.post("/api/rescan")
@@ -1777,8 +2138,9 @@ async def api_rescan(payload: Dict[str, Any] = Body(default={})) -> Dict[str, An
 
 
 @app.get("/api/scan/status", response_model=ScanStatusResponse)
-async def api_scan_status() -> ScanStatusResponse:
-    return ScanStatusResponse.from_status(scan_controller.status, rescan_status=rescan_controller.status)
+async def api_scan_status(request: Request) -> Response:
+    status = ScanStatusResponse.from_status(scan_controller.status, rescan_status=rescan_controller.status)
+    return _adapter_response(_SCAN_STATUS_ADAPTER, status, request)
 
 
 @app.post("/api/scan/start", response_model=ScanStartResponse)
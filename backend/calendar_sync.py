@@ -28,7 +28,6 @@ from database import (
 )
 from mailbox import MessageContent, add_message_tag, fetch_recent_messages, move_message
 from models import CalendarEventEntry
-from settings import S
 from runtime_settings import resolve_mailbox_inbox
 from utils import message_received_at, subject_from
 
@@ -5,14 +5,19 @@ import json
 import logging
 import os
 import threading
+import time
+from collections import Counter
 from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import Any, Dict, Iterator, List, Optional, Sequence, Set
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
-from sqlalchemy import func
+from sqlalchemy import func, update
 from sqlmodel import Session, SQLModel, create_engine, select
+from sqlmodel.sql.expression import SelectOfScalar
 
 from models import AppConfig, CalendarEventEntry, FilterHit, FolderProfile, Processed, Suggestion
+from pending_stream import mark_dirty
 from settings import S
 
 
@@ -24,7 +29,15 @@ logger = logging.getLogger(__name__)
 
 def _make_engine():
     connect_args = {"check_same_thread": False} if S.DATABASE_URL.startswith("sqlite") else {}
-    return create_engine(S.DATABASE_URL, echo=False, connect_args=connect_args)
+    pool_args: Dict[str, Any] = {"pool_pre_ping": True}
+    in_memory = S.DATABASE_URL in {"sqlite://", "sqlite:///:memory:"}
+    if not in_memory:
+        pool_args.update(
+            pool_size=max(int(S.DATABASE_POOL_SIZE), 1),
+            max_overflow=max(int(S.DATABASE_MAX_OVERFLOW), 0),
+            pool_recycle=3600,
+        )
+    return create_engine(S.DATABASE_URL, echo=False, connect_args=connect_args, **pool_args)
 
 
 engine = _make_engine()
@@ -75,12 +88,13 @@ def init_db() -> None:
                 _reset_sqlite_file()
         SQLModel.metadata.create_all(engine)
         _schema_ready = True
+    _invalidate_config_values()
 
 
 @contextmanager
-def get_session() -> Iterator[Session]:
+def get_session(expire_on_commit: bool = True) -> Iterator[Session]:
     _ensure_schema()
-    with Session(engine) as session:
+    with Session(engine, expire_on_commit=expire_on_commit) as session:
         yield session
 
 
@@ -97,45 +111,134 @@ def save_suggestion(sug: Suggestion) -> None:
         else:
             ses.add(sug)
         ses.commit()
+    _invalidate_status_counts()
+
+
+def _suggestions_query(include_all: bool) -> SelectOfScalar[Suggestion]:
+    stmt = select(Suggestion).order_by(Suggestion.id.desc())
+    if not include_all:
+        stmt = stmt.where(Suggestion.status == "open")
+    return stmt
 
 
-def list_suggestions(include_all: bool = False) -> List[Suggestion]:
+def iter_suggestions(include_all: bool = False, batch_size: int = 500) -> Iterator[Suggestion]:
+    """Yield suggestions batch by batch instead of loading the full result set."""
+
     with get_session() as ses:
-        stmt = select(Suggestion).order_by(Suggestion.id.desc())
-        if not include_all:
-            stmt = stmt.where(Suggestion.status == "open")
-        return ses.exec(stmt).all()
+        yield from ses.exec(_suggestions_query(include_all).execution_options(yield_per=batch_size))
 
 
-def suggestion_status_counts() -> Dict[str, int]:
+STATUS_COUNTS_RECONCILE_SECONDS = 60.0
+
+_counts_lock = threading.Lock()
+_counts_generation = 0
+_counts_cache: Optional[tuple[float, Dict[str, int]]] = None
+
+
+def _count_statuses(ses: Session) -> Dict[str, int]:
+    return _tally_statuses(ses.exec(select(Suggestion.status, func.count()).group_by(Suggestion.status)).all())
+
+
+def _tally_statuses(rows: Iterable[Tuple[Optional[str], int]]) -> Dict[str, int]:
     counts = {"open": 0, "decided": 0, "error": 0}
     total = 0
-    with get_session() as ses:
-        rows = ses.exec(select(Suggestion.status, func.count()).group_by(Suggestion.status)).all()
-        for status, amount in rows:
-            count = int(amount or 0)
-            normalized = (status or "open").strip().lower()
-            if normalized == "open":
-                counts["open"] += count
-            elif normalized == "error":
-                counts["error"] += count
-            else:
-                counts["decided"] += count
-            total += count
+    for status, amount in rows:
+        count = int(amount or 0)
+        normalized = (status or "open").strip().lower()
+        if normalized == "open":
+            counts["open"] += count
+        elif normalized == "error":
+            counts["error"] += count
+        else:
+            counts["decided"] += count
+        total += count
     counts["total"] = total
     return counts
 
 
+def _invalidate_status_counts() -> None:
+    global _counts_generation, _counts_cache
+    with _counts_lock:
+        _counts_generation += 1
+        _counts_cache = None
+
+
+def _changed() -> None:
+    _invalidate_status_counts()
+    mark_dirty()
+
+
+def suggestion_status_counts() -> Dict[str, int]:
+    """Return status counters, recounting only after changes.
+
+    Status transitions in this process drop the cached counters. Suggestions the
+    worker inserts from its own process are picked up by recounting at least every
+    ``STATUS_COUNTS_RECONCILE_SECONDS``.
+    """
+
+    with get_session() as ses:
+        return _status_counts(ses)
+
+
+def _status_counts(ses: Session, rows: Optional[Sequence[Suggestion]] = None) -> Dict[str, int]:
+    """Return cached counters, recounting on a miss.
+
+    ``rows`` may hold every suggestion already loaded in ``ses``; a miss is then
+    tallied from them instead of running the ``GROUP BY`` query.
+    """
+
+    global _counts_cache
+    with _counts_lock:
+        cached, generation = _counts_cache, _counts_generation
+    if cached is not None and time.monotonic() - cached[0] < STATUS_COUNTS_RECONCILE_SECONDS:
+        return dict(cached[1])
+    if rows is None:
+        counts = _count_statuses(ses)
+    else:
+        counts = _tally_statuses(Counter(row.status for row in rows).items())
+    with _counts_lock:
+        if generation == _counts_generation:
+            _counts_cache = (time.monotonic(), counts)
+    return dict(counts)
+
+
+def list_suggestions_with_counts(include_all: bool = False) -> Tuple[List[Suggestion], Dict[str, int]]:
+    """Load suggestions and status counters through one session and connection."""
+
+    with get_session() as ses:
+        rows = ses.exec(_suggestions_query(include_all)).all()
+        return rows, _status_counts(ses, rows if include_all else None)
+
+
 def find_suggestion_by_uid(uid: str) -> Optional[Suggestion]:
     with get_session() as ses:
         return ses.exec(select(Suggestion).where(Suggestion.message_uid == uid)).first()
 
 
-def record_decision(uid: str, decision: str) -> Optional[Suggestion]:
+def find_suggestions_by_uids(uids: Iterable[str]) -> Dict[str, Suggestion]:
+    unique = {str(uid) for uid in uids if uid}
+    if not unique:
+        return {}
     with get_session() as ses:
-        row = ses.exec(select(Suggestion).where(Suggestion.message_uid == uid)).first()
-        if not row:
-            return None
+        rows = ses.exec(select(Suggestion).where(Suggestion.message_uid.in_(unique))).all()
+    found: Dict[str, Suggestion] = {}
+    for row in rows:
+        found.setdefault(row.message_uid, row)
+    return found
+
+
+def record_decision(uid: str, decision: str, *, row: Suggestion | None = None) -> Optional[Suggestion]:
+    """Store a decision.
+
+    Callers that already loaded the suggestion pass it as ``row`` so the update is
+    written without selecting it again.
+    """
+
+    with get_session(expire_on_commit=False) as ses:
+        if row is None:
+            row = ses.exec(select(Suggestion).where(Suggestion.message_uid == uid)).first()
+            if not row:
+                return None
         row.decision = decision
         row.decided_at = datetime.utcnow()
         if decision == "reject":
@@ -143,38 +246,111 @@ def record_decision(uid: str, decision: str) -> Optional[Suggestion]:
             row.move_status = "rejected"
         ses.add(row)
         ses.commit()
-        ses.refresh(row)
+        _changed()
         return row
 
 
-def record_dry_run(uid: str, result: dict) -> None:
+def record_decided_move(uid: str, decision: str, error: str | None = None) -> None:
+    """Store a decision together with the outcome of the move that followed it.
+
+    Callers perform the IMAP move first, so no session is held open across it;
+    ``error`` carries the move failure, if any.
+    """
+
+    if error is None:
+        outcome: Dict[str, Any] = {"move_status": "moved", "status": "decided"}
+    else:
+        outcome = {"move_status": "failed", "move_error": error, "status": "error"}
+    _update_suggestions([uid], decision=decision, decided_at=datetime.utcnow(), **outcome)
+
+
+def _update_suggestions(uids: Sequence[str], *, notify: bool = True, **values: Any) -> None:
+    unique = {str(uid) for uid in uids if uid}
+    if not unique:
+        return
     with get_session() as ses:
-        row = ses.exec(select(Suggestion).where(Suggestion.message_uid == uid)).first()
-        if row:
-            row.dry_run_result = result
-            ses.add(row)
-            ses.commit()
+        ses.exec(update(Suggestion).where(Suggestion.message_uid.in_(unique)).values(**values))
+        ses.commit()
+    if notify:
+        _changed()
+
+
+def record_dry_run(uid: str, result: dict) -> None:
+    # A dry run changes neither status nor pending state, so the stream stays untouched.
+    _update_suggestions([uid], notify=False, dry_run_result=result)
 
 
 def mark_moved(uid: str) -> None:
+    _update_suggestions([uid], move_status="moved", status="decided")
+
+
+def record_bulk_outcomes(moved: Sequence[str], failed: Dict[str, str], dry_runs: Dict[str, bool]) -> None:
+    """Store the results of a bulk move in one transaction.
+
+    Rows sharing an outcome are updated together, so a request costs one ``UPDATE`` per
+    distinct outcome (moved, each error text, target present/missing) and one commit.
+    """
+
+    batches: List[Tuple[Iterable[str], Dict[str, Any]]] = []
+    if moved:
+        batches.append((moved, {"move_status": "moved", "status": "decided"}))
+    by_error: Dict[str, List[str]] = {}
+    for uid, error in failed.items():
+        by_error.setdefault(error, []).append(uid)
+    for error, uids in by_error.items():
+        batches.append((uids, {"move_status": "failed", "move_error": error, "status": "error"}))
+    for exists in (True, False):
+        uids = [uid for uid, found in dry_runs.items() if found is exists]
+        if uids:
+            batches.append((uids, {"dry_run_result": {"folder_exists": exists}}))
+    if not batches:
+        return
     with get_session() as ses:
-        row = ses.exec(select(Suggestion).where(Suggestion.message_uid == uid)).first()
-        if row:
-            row.move_status = "moved"
-            row.status = "decided"
-            ses.add(row)
-            ses.commit()
+        for uids, values in batches:
+            ses.exec(update(Suggestion).where(Suggestion.message_uid.in_(set(uids))).values(**values))
+        ses.commit()
+    if moved or failed:
+        _changed()
 
 
 def mark_failed(uid: str, err: str) -> None:
+    _update_suggestions([uid], move_status="failed", move_error=err, status="error")
+
+
+CONFIG_VALUES_TTL_SECONDS = 5.0
+
+_config_lock = threading.Lock()
+_config_generation = 0
+_config_cache: Optional[tuple[float, Dict[str, str]]] = None
+
+
+def _invalidate_config_values() -> None:
+    global _config_generation, _config_cache
+    with _config_lock:
+        _config_generation += 1
+        _config_cache = None
+
+
+def _config_values() -> Dict[str, str]:
+    """Return all persisted overrides, loaded with one query and shared between readers.
+
+    Writes in this process drop the cache immediately; overrides written by another
+    process (API vs. worker) are picked up after ``CONFIG_VALUES_TTL_SECONDS``.
+    """
+
+    global _config_cache
+    with _config_lock:
+        cached, generation = _config_cache, _config_generation
+    if cached is not None and time.monotonic() - cached[0] < CONFIG_VALUES_TTL_SECONDS:
+        return cached[1]
+    values: Dict[str, str] = {}
     with get_session() as ses:
-        row = ses.exec(select(Suggestion).where(Suggestion.message_uid == uid)).first()
-        if row:
-            row.move_status = "failed"
-            row.move_error = err
-            row.status = "error"
-            ses.add(row)
-            ses.commit()
+        for entry in ses.exec(select(AppConfig).order_by(AppConfig.id)).all():
+            values.setdefault(entry.key, entry.value)
+    with _config_lock:
+        if generation == _config_generation:
+            _config_cache = (time.monotonic(), values)
+    return values
 
 
 def _set_config_value(key: str, value: str) -> None:
@@ -186,12 +362,11 @@ def _set_config_value(key: str, value: str) -> None:
             entry.value = value
         ses.add(entry)
         ses.commit()
+    _invalidate_config_values()
 
 
 def _get_config_value(key: str) -> Optional[str]:
-    with get_session() as ses:
-        entry = ses.exec(select(AppConfig).where(AppConfig.key == key)).first()
-        return entry.value if entry else None
+    return _config_values().get(key)
 
 
 def set_mode(mode: str) -> None:
@@ -407,17 +582,25 @@ def set_monitored_folders(folders: Sequence[str]) -> None:
     unique = list(dict.fromkeys(str(folder) for folder in folders if str(folder).strip()))
     payload = json.dumps(unique)
     _set_config_value("MONITORED_FOLDERS", payload)
+    mark_dirty()
 
 
 def get_monitored_folders() -> List[str]:
     raw = _get_config_value("MONITORED_FOLDERS")
     if not raw:
         return []
+    return list(_parse_monitored_folders(raw))
+
+
+@lru_cache(maxsize=8)
+def _parse_monitored_folders(raw: str) -> Tuple[str, ...]:
+    """Decode the stored folder selection once per distinct value; scans and polls reread it constantly."""
+
     try:
         data = json.loads(raw)
     except json.JSONDecodeError:
-        return []
-    return [str(folder) for folder in data if isinstance(folder, str) and folder.strip()]
+        return ()
+    return tuple(str(folder) for folder in data if isinstance(folder, str) and folder.strip())
 
 
 def update_proposal(uid: str, proposal: Dict[str, Any] | None) -> Optional[Suggestion]:
@@ -428,6 +611,7 @@ def update_proposal(uid: str, proposal: Dict[str, Any] | None) -> Optional[Sugge
         row.proposal = proposal
         ses.add(row)
         ses.commit()
+        mark_dirty()
         ses.refresh(row)
         return row
 
@@ -547,7 +731,7 @@ def filter_activity_summary(
                 "name": rule_name,
                 "target_folder": target_folder,
                 "count": int(count or 0),
-                "last_match": (last_match.isoformat() if isinstance(last_match, datetime) else None),
+                "last_match": last_match if isinstance(last_match, datetime) else None,
             }
         )
 
@@ -561,8 +745,8 @@ def filter_activity_summary(
                 "target_folder": row.target_folder,
                 "applied_tags": row.applied_tags or [],
                 "matched_terms": row.matched_terms or [],
-                "matched_at": row.matched_at.isoformat(),
-                "message_date": row.message_date.isoformat() if row.message_date else None,
+                "matched_at": row.matched_at,
+                "message_date": row.message_date,
             }
         )
 
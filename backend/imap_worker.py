@@ -8,7 +8,7 @@ import logging
 import os
 import re
 from email import policy
-from typing import Sequence
+from typing import Dict, Sequence
 
 from classifier import (
     build_embedding_prompt,
@@ -31,6 +31,7 @@ from database import (
 )
 from feedback import update_profiles_on_accept
 from mailbox import (
+    MessageContent,
     add_message_tag,
     ensure_folder_path,
     fetch_recent_messages,
@@ -40,6 +41,7 @@ from mailbox import (
 from models import Suggestion
 from runtime_settings import resolve_mailbox_inbox
 from ollama_service import ensure_ollama_ready
+from pending_stream import mark_dirty
 from settings import S
 from runtime_settings import (
     analysis_module_uses_filters,
@@ -137,6 +139,12 @@ async def process_loop() -> None:
         await asyncio.sleep(S.POLL_INTERVAL_SECONDS)
 
 
+async def _fetch_folder(folder: str, slots: asyncio.Semaphore) -> Dict[int, MessageContent]:
+    async with slots:
+        payloads = await asyncio.to_thread(fetch_recent_messages, [folder])
+    return payloads.get(folder, {})
+
+
 async def one_shot_scan(folders: Sequence[str] | None = None) -> int:
     """Scan the configured folders once and create suggestions for unseen mails."""
 
@@ -146,11 +154,17 @@ async def one_shot_scan(folders: Sequence[str] | None = None) -> int:
         configured = get_monitored_folders()
         inbox = resolve_mailbox_inbox()
         target_folders = configured or [inbox]
-    messages = await asyncio.to_thread(fetch_recent_messages, target_folders)
-    all_folders = await asyncio.to_thread(list_folders)
+    # Each folder is fetched over its own pooled connection so SELECT/SEARCH/FETCH
+    # rounds overlap; messages are still classified one after another.
+    scan_folders = list(dict.fromkeys(target_folders))
+    slots = asyncio.Semaphore(max(int(S.IMAP_POOL_SIZE), 1))
+    async with asyncio.TaskGroup() as group:
+        fetches = [group.create_task(_fetch_folder(folder, slots)) for folder in scan_folders]
+        structure = group.create_task(asyncio.to_thread(list_folders))
+    all_folders = structure.result()
     processed = 0
-    for folder, payloads in messages.items():
-        for uid, meta in payloads.items():
+    for folder, fetch in zip(scan_folders, fetches):
+        for uid, meta in fetch.result().items():
             uid_str = str(uid)
             raw_bytes = meta.body if hasattr(meta, "body") else meta
             if not raw_bytes or is_processed(folder, uid_str):
@@ -161,6 +175,8 @@ async def one_shot_scan(folders: Sequence[str] | None = None) -> int:
                 processed += 1
             except Exception:  # pragma: no cover - defensive background handling
                 logger.exception("Failed to process message %s in %s", uid, folder)
+    if processed:
+        mark_dirty()
     return processed
 
 
@@ -62,7 +62,7 @@ def _write_raw_config(data: dict) -> None:
     with _CONFIG_PATH.open("w", encoding="utf-8") as handle:
         json.dump(data, handle, ensure_ascii=False, indent=2)
         handle.write("\n")
-    get_filter_rules.cache_clear()
+    _parse_filter_rules.cache_clear()
 
 
 def get_filter_config() -> dict:
@@ -104,8 +104,27 @@ def _normalise_fields(fields: Iterable[object]) -> tuple[str, ...]:
     return tuple(filtered) if filtered else ("subject", "sender", "body")
 
 
-@lru_cache(maxsize=1)
+def filter_config_mtime_ns() -> int:
+    """Return the modification time of the filter file, or ``0`` while it does not exist."""
+
+    try:
+        return _CONFIG_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
 def get_filter_rules() -> tuple[KeywordFilterRule, ...]:
+    """Return the parsed rules, reparsing whenever the file changed on disk.
+
+    Keying the cache on the file's mtime picks up edits made by hand or by the worker
+    process, which never clear this process' cache.
+    """
+
+    return _parse_filter_rules(filter_config_mtime_ns())
+
+
+@lru_cache(maxsize=1)
+def _parse_filter_rules(mtime_ns: int) -> tuple[KeywordFilterRule, ...]:
     raw = _load_raw_config()
     entries = raw.get("rules", [])
     rules: List[KeywordFilterRule] = []
@@ -3,18 +3,23 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from concurrent.futures import Future
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import Dict, Iterable, Iterator, List, Sequence
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
 
 from imapclient import IMAPClient
 
+from mail_settings import MailboxSettings
 from runtime_settings import (
     resolve_mailbox_inbox,
     resolve_mailbox_settings,
     resolve_mailbox_tags,
 )
+from settings import S
 
 
 logger = logging.getLogger(__name__)
@@ -26,28 +31,153 @@ class MessageContent:
     flags: Sequence[str]
 
 
+def _logout(server: IMAPClient) -> None:
+    try:
+        server.logout()
+    except Exception:  # pragma: no cover - best effort cleanup
+        logger.debug("Failed to logout from IMAP server", exc_info=True)
+
+
+class _ConnectionPool:
+    """LIFO pool of authenticated IMAP connections for the current account.
+
+    Connections are checked with ``NOOP`` before reuse and replaced transparently if
+    the server dropped them. At most ``IMAP_POOL_SIZE`` idle connections are kept;
+    changing the account settings discards the idle connections of the old account.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = max(size, 0)
+        self._lock = threading.Lock()
+        self._key: Tuple[object, ...] | None = None
+        self._idle: List[IMAPClient] = []
+
+    def acquire(self, key: Tuple[object, ...]) -> IMAPClient | None:
+        while True:
+            stale: List[IMAPClient] = []
+            with self._lock:
+                if key != self._key:
+                    stale, self._idle, self._key = self._idle, [], key
+                server = self._idle.pop() if self._idle else None
+            for old in stale:
+                _logout(old)
+            if server is None:
+                return None
+            try:
+                server.noop()
+                return server
+            except Exception:  # pragma: no cover - network interaction
+                logger.debug("Discarding stale IMAP connection", exc_info=True)
+                _logout(server)
+
+    def release(self, key: Tuple[object, ...], server: IMAPClient) -> None:
+        with self._lock:
+            if key == self._key and len(self._idle) < self._size:
+                self._idle.append(server)
+                return
+        _logout(server)
+
+    def clear(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for server in idle:
+            _logout(server)
+
+
+_pool = _ConnectionPool(int(S.IMAP_POOL_SIZE))
+
+
+def _open_connection(settings: MailboxSettings) -> IMAPClient:
+    server = IMAPClient(settings.host, port=settings.port, ssl=settings.use_ssl)
+    server.login(settings.username, settings.password or "")
+    return server
+
+
 @contextmanager
 def _connect() -> Iterator[IMAPClient]:
     settings = resolve_mailbox_settings(include_password=True)
-    server = IMAPClient(settings.host, port=settings.port, ssl=settings.use_ssl)
-    server.login(settings.username, settings.password or "")
+    key = (settings.host, settings.port, settings.use_ssl, settings.username, settings.password)
+    server = _pool.acquire(key) or _open_connection(settings)
     try:
         yield server
-    finally:
-        try:
-            server.logout()
-        except Exception:  # pragma: no cover - best effort cleanup
-            logger.debug("Failed to logout from IMAP server", exc_info=True)
+    except BaseException:
+        _logout(server)
+        raise
+    _pool.release(key, server)
+
+
+def warm_up_pool() -> None:
+    """Open one pooled connection ahead of the first request."""
+
+    try:
+        with _connect():
+            pass
+    except Exception as exc:  # pragma: no cover - network interaction
+        logger.warning("Could not pre-connect to IMAP server: %s", exc)
+
+
+def close_pool() -> None:
+    _pool.clear()
+
+
+FOLDER_CACHE_TTL_SECONDS = 30.0
+
+_folder_cache_lock = threading.Lock()
+_folder_cache: Dict[Tuple[str, int, str], Tuple[float, List[str]]] = {}
+_folder_inflight: Dict[Tuple[str, int, str], Future[List[str]]] = {}
+_folder_generation = 0
+
+
+def _account_key() -> Tuple[str, int, str]:
+    settings = resolve_mailbox_settings(include_password=False)
+    return (settings.host, int(settings.port), settings.username)
+
+
+def invalidate_folder_cache() -> None:
+    global _folder_generation
+    with _folder_cache_lock:
+        _folder_cache.clear()
+        # LISTs already running may predate the change; later callers start a fresh one.
+        _folder_inflight.clear()
+        _folder_generation += 1
 
 
 def list_folders() -> list[str]:
+    """Return all folder names, sharing one IMAP LIST among concurrent callers.
+
+    Results are cached per account for ``FOLDER_CACHE_TTL_SECONDS``; failures are not
+    cached so the next caller retries immediately. The LIST itself runs outside the
+    cache lock, so a slow server only delays callers waiting for the same account.
+    """
+
+    key = _account_key()
+    with _folder_cache_lock:
+        cached = _folder_cache.get(key)
+        if cached and time.monotonic() - cached[0] < FOLDER_CACHE_TTL_SECONDS:
+            return list(cached[1])
+        pending = _folder_inflight.get(key)
+        if pending is None:
+            future: Future[List[str]] = Future()
+            _folder_inflight[key] = future
+            generation = _folder_generation
+    if pending is not None:
+        return list(pending.result())
+
+    folders: List[str] | None = None
     try:
         with _connect() as server:
             response = server.list_folders()
-            return [folder[2] for folder in response]
+            folders = [folder[2] for folder in response]
     except Exception as exc:  # pragma: no cover - network interaction
         logger.warning("Could not list folders: %s", exc)
-        return []
+    finally:
+        with _folder_cache_lock:
+            if _folder_inflight.get(key) is future:
+                del _folder_inflight[key]
+            if folders is not None and generation == _folder_generation:
+                _folder_cache[key] = (time.monotonic(), folders)
+        future.set_result(folders or [])
+    return list(folders or [])
 
 
 def folder_exists(name: str) -> bool:
@@ -157,18 +287,63 @@ def add_message_tag(uid: str, folder: str, tag: str) -> None:
             )
 
 
+def _move_selected(server: IMAPClient, uids: List[int], target_folder: str) -> None:
+    try:
+        server.move(uids, target_folder)
+    except Exception as exc:  # pragma: no cover - depends on IMAP server
+        logger.warning("Direct move failed (%s), falling back to copy+delete", exc)
+        server.copy(uids, target_folder)
+        server.delete_messages(uids)
+        server.expunge()
+
+
 def move_message(uid: str, target_folder: str, src_folder: str | None = None) -> None:
     inbox = resolve_mailbox_inbox()
     with _connect() as server:
         server.select_folder(src_folder or inbox)
         i_uid = int(uid) if not isinstance(uid, int) else uid
+        _move_selected(server, [i_uid], target_folder)
+
+
+def move_messages(
+    uids: Sequence[str],
+    target_folder: str,
+    src_folder: str | None = None,
+) -> Dict[str, str | None]:
+    """Move several messages sharing source and target with a single UID MOVE.
+
+    Returns a mapping of UID to error message (``None`` for moved messages). If the
+    batched command is rejected, every UID is retried individually so that only the
+    failing messages are reported.
+    """
+
+    if not uids:
+        return {}
+    inbox = resolve_mailbox_inbox()
+    numeric = [int(uid) for uid in uids]
+    with _connect() as server:
+        server.select_folder(src_folder or inbox)
         try:
-            server.move([i_uid], target_folder)
+            _move_selected(server, numeric, target_folder)
         except Exception as exc:  # pragma: no cover - depends on IMAP server
-            logger.warning("Direct move failed (%s), falling back to copy+delete", exc)
-            server.copy([i_uid], target_folder)
-            server.delete_messages([i_uid])
-            server.expunge()
+            logger.warning(
+                "Batch move of %s messages to %s failed (%s), retrying individually",
+                len(numeric),
+                target_folder,
+                exc,
+            )
+        else:
+            return {str(uid): None for uid in uids}
+
+        results: Dict[str, str | None] = {}
+        for uid, i_uid in zip(uids, numeric):
+            try:
+                _move_selected(server, [i_uid], target_folder)
+            except Exception as item_exc:  # pragma: no cover - depends on IMAP server
+                results[str(uid)] = str(item_exc)
+            else:
+                results[str(uid)] = None
+        return results
 
 
 def ensure_folder_path(path: str) -> str:
@@ -182,40 +357,43 @@ def ensure_folder_path(path: str) -> str:
     if not segments:
         raise ValueError("invalid folder path")
 
-    with _connect() as server:
-        try:
-            existing_response = server.list_folders()
-            delimiter = next(
-                (item[1] for item in existing_response if isinstance(item[1], str) and item[1]),
-                "/",
-            )
-            existing_server = {folder[2] for folder in existing_response}
-            existing_display = {
-                (name.replace(delimiter, "/") if isinstance(name, str) else "")
-                for name in existing_server
-            }
-        except Exception as exc:  # pragma: no cover - network interaction
-            logger.warning("Could not fetch current folders before creating %s: %s", normalized, exc)
-            delimiter = "/"
-            existing_server = set()
-            existing_display = set()
-
-        created_path_parts: List[str] = []
-        for segment in segments:
-            created_path_parts.append(segment)
-            display_candidate = "/".join(created_path_parts)
-            server_candidate = (
-                delimiter.join(created_path_parts) if delimiter and delimiter != "/" else display_candidate
-            )
-            if display_candidate in existing_display or server_candidate in existing_server:
-                continue
+    try:
+        with _connect() as server:
             try:
-                server.create_folder(server_candidate)
-                existing_server.add(server_candidate)
-                existing_display.add(display_candidate)
-                logger.info("Created IMAP folder %s", display_candidate)
-            except Exception as exc:  # pragma: no cover - server specific behaviour
-                logger.error("Failed to create IMAP folder %s: %s", server_candidate, exc)
-                raise
+                existing_response = server.list_folders()
+                delimiter = next(
+                    (item[1] for item in existing_response if isinstance(item[1], str) and item[1]),
+                    "/",
+                )
+                existing_server = {folder[2] for folder in existing_response}
+                existing_display = {
+                    (name.replace(delimiter, "/") if isinstance(name, str) else "")
+                    for name in existing_server
+                }
+            except Exception as exc:  # pragma: no cover - network interaction
+                logger.warning("Could not fetch current folders before creating %s: %s", normalized, exc)
+                delimiter = "/"
+                existing_server = set()
+                existing_display = set()
+
+            created_path_parts: List[str] = []
+            for segment in segments:
+                created_path_parts.append(segment)
+                display_candidate = "/".join(created_path_parts)
+                server_candidate = (
+                    delimiter.join(created_path_parts) if delimiter and delimiter != "/" else display_candidate
+                )
+                if display_candidate in existing_display or server_candidate in existing_server:
+                    continue
+                try:
+                    server.create_folder(server_candidate)
+                    existing_server.add(server_candidate)
+                    existing_display.add(display_candidate)
+                    logger.info("Created IMAP folder %s", display_candidate)
+                except Exception as exc:  # pragma: no cover - server specific behaviour
+                    logger.error("Failed to create IMAP folder %s: %s", server_candidate, exc)
+                    raise
+    finally:
+        invalidate_folder_cache()
 
     return "/".join(segments)
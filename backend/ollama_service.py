@@ -5,7 +5,8 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from dataclasses import asdict, dataclass, field
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, Iterable, List, Tuple
 
@@ -82,7 +83,11 @@ class ModelPullProgress:
         self.finished_at = datetime.now(timezone.utc)
 
 
+STATUS_MAX_AGE_SECONDS = 5.0
+
 _STATUS_CACHE: OllamaStatus | None = None
+_STATUS_KEY: Tuple[Tuple[str, str], ...] = ()
+_STATUS_CACHED_AT = 0.0
 _STATUS_LOCK = asyncio.Lock()
 _MODEL_INFO_CACHE: Dict[str, Dict[str, Any]] = {}
 _MODEL_INFO_LOCK = asyncio.Lock()
@@ -473,15 +478,33 @@ def _models_to_check() -> List[Tuple[str, str]]:
     return mapping
 
 
-async def refresh_status(pull_missing: bool = False) -> OllamaStatus:
+def _fresh_status(max_age: float | None) -> OllamaStatus | None:
+    """Return the cached status if it is younger than ``max_age`` and still describes the configured models.
+
+    While a model is being pulled the cache is bypassed so progress stays live.
+    """
+
+    status = _STATUS_CACHE
+    if status is None or not max_age or time.monotonic() - _STATUS_CACHED_AT >= max_age:
+        return None
+    if _STATUS_KEY != tuple(_models_to_check()) or any(model.pulling for model in status.models):
+        return None
+    return status
+
+
+async def refresh_status(pull_missing: bool = False, max_age: float | None = None) -> OllamaStatus:
     async with _STATUS_LOCK:
+        if not pull_missing and (cached := _fresh_status(max_age)) is not None:
+            return cached
         try:
             status = await _probe_status(pull_missing)
         except Exception as exc:  # pragma: no cover - defensive network guard
             logger.exception("Ollama-Statusprüfung fehlgeschlagen", exc_info=True)
             status = _failure_status(f"Ollama-Status konnte nicht ermittelt werden: {exc}")
-        global _STATUS_CACHE
+        global _STATUS_CACHE, _STATUS_KEY, _STATUS_CACHED_AT
         _STATUS_CACHE = status
+        _STATUS_KEY = tuple(_models_to_check())
+        _STATUS_CACHED_AT = time.monotonic()
         return status
 
 
@@ -526,12 +549,17 @@ async def ensure_ollama_ready() -> OllamaStatus:
     return status
 
 
-async def get_status(force_refresh: bool = False) -> OllamaStatus:
+async def get_status(force_refresh: bool = False, max_age: float | None = None) -> OllamaStatus:
+    """Return the Ollama status, probing the host when needed.
+
+    ``force_refresh`` always probes unless ``max_age`` is given, in which case a
+    cached status younger than ``max_age`` seconds is reused. Concurrent callers
+    wait on the same probe.
+    """
+
     async with _STATUS_LOCK:
         if not force_refresh and _STATUS_CACHE is not None:
             return _STATUS_CACHE
-    return await refresh_status(pull_missing=False)
-
-
-def status_as_dict(status: OllamaStatus) -> Dict[str, Any]:
-    return asdict(status)
+        if (cached := _fresh_status(max_age)) is not None:
+            return cached
+    return await refresh_status(pull_missing=False, max_age=max_age)
@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import email
+import time
 from dataclasses import dataclass
 from email import policy
-from typing import List, Sequence
+from typing import Dict, List, Sequence, Tuple
 
 from database import get_monitored_folders, known_suggestion_uids, processed_uids_by_folder
 from mailbox import MessageContent, fetch_recent_messages
+from pending_stream import hub as pending_hub
 from settings import S
 from utils import subject_from
 
@@ -51,14 +53,57 @@ class PendingOverview:
         return len(self.pending)
 
 
+PENDING_CACHE_TTL_SECONDS = 3.0
+PENDING_STALE_SECONDS = 30.0
+
+_overview_cache: Dict[Tuple[int, Tuple[str, ...]], "asyncio.Task[PendingOverview]"] = {}
+_last_overview: Dict[Tuple[str, ...], Tuple[int, float, PendingOverview]] = {}
+
+
+def _target_folders(folders: Sequence[str] | None) -> List[str]:
+    if folders is not None:
+        return [str(folder) for folder in folders if str(folder).strip()]
+    configured = get_monitored_folders()
+    return [str(folder) for folder in configured] or [S.IMAP_INBOX]
+
+
+async def get_pending_overview(folders: Sequence[str] | None = None, *, allow_stale: bool = False) -> PendingOverview:
+    """Return the pending overview, sharing one IMAP fetch among concurrent callers.
+
+    Results stay cached for ``PENDING_CACHE_TTL_SECONDS`` per folder selection and are
+    discarded as soon as the pending stream is marked dirty. With ``allow_stale`` an
+    overview of the same revision that is younger than ``PENDING_STALE_SECONDS`` is
+    returned right away while a refresh runs in the background.
+    """
+
+    target_folders = tuple(_target_folders(folders))
+    revision = pending_hub.revision
+    key = (revision, target_folders)
+    task = _overview_cache.get(key)
+    if task is None:
+        task = asyncio.create_task(load_pending_overview(target_folders))
+        _overview_cache[key] = task
+        task.add_done_callback(lambda finished: _expire_overview(key, finished))
+    if allow_stale and not task.done():
+        last = _last_overview.get(target_folders)
+        if last is not None and last[0] == revision and time.monotonic() - last[1] < PENDING_STALE_SECONDS:
+            return last[2]
+    return await asyncio.shield(task)
+
+
+def _expire_overview(key: Tuple[int, Tuple[str, ...]], task: "asyncio.Task[PendingOverview]") -> None:
+    if task.cancelled() or task.exception() is not None:
+        _overview_cache.pop(key, None)
+        return
+    revision, folders = key
+    _last_overview[folders] = (revision, time.monotonic(), task.result())
+    asyncio.get_running_loop().call_later(PENDING_CACHE_TTL_SECONDS, _overview_cache.pop, key, None)
+
+
 async def load_pending_overview(folders: Sequence[str] | None = None) -> PendingOverview:
     """Return metadata about messages that still await automated processing."""
 
-    if folders is not None:
-        target_folders: List[str] = [str(folder) for folder in folders if str(folder).strip()]
-    else:
-        configured = get_monitored_folders()
-        target_folders = [str(folder) for folder in configured] or [S.IMAP_INBOX]
+    target_folders = _target_folders(folders)
     raw_payloads = await asyncio.to_thread(fetch_recent_messages, target_folders)
     processed_map = processed_uids_by_folder(target_folders)
     known_suggestions = known_suggestion_uids()
@@ -0,0 +1,247 @@
+"""Event-driven fan-out of the pending overview to WebSocket and SSE clients."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Protocol, Tuple
+
+import orjson
+
+from settings import S
+
+logger = logging.getLogger(__name__)
+
+PING_INTERVAL_SECONDS = 30.0
+SEND_TIMEOUT_SECONDS = 1.0
+MAX_SLOW_STRIKES = 3
+FULL_SNAPSHOT_EVERY = 10
+_PING_MESSAGE = orjson.dumps({"type": "ping"}).decode()
+
+SSE_QUEUE_SIZE = 16
+
+Producer = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+class StreamClient(Protocol):
+    """What the hub needs from a subscriber; satisfied by Starlette's ``WebSocket``."""
+
+    async def send_text(self, data: str) -> None: ...
+
+    async def close(self, code: int = 1000) -> None: ...
+
+
+class SseClient:
+    """Adapts a Server-Sent-Events response to the hub's client interface.
+
+    Messages are buffered in a bounded queue that :meth:`events` drains. A full queue
+    is reported to the hub as a timed-out send, so slow SSE clients get the same
+    resync and disconnect handling as slow WebSockets.
+    """
+
+    def __init__(self) -> None:
+        self._queue: asyncio.Queue[Optional[str]] = asyncio.Queue(maxsize=SSE_QUEUE_SIZE)
+
+    async def send_text(self, data: str) -> None:
+        try:
+            self._queue.put_nowait(data)
+        except asyncio.QueueFull as exc:
+            raise asyncio.TimeoutError() from exc
+
+    async def close(self, code: int = 1000) -> None:
+        while True:
+            try:
+                self._queue.put_nowait(None)
+                return
+            except asyncio.QueueFull:
+                self._queue.get_nowait()
+
+    async def events(self) -> AsyncIterator[str]:
+        while True:
+            message = await self._queue.get()
+            if message is None:
+                return
+            yield f"data: {message}\n\n"
+
+
+@dataclass(slots=True)
+class _ClientState:
+    synced: bool = False
+    strikes: int = 0
+
+
+def _pending_key(entry: Dict[str, Any]) -> Tuple[str, str]:
+    return (str(entry.get("folder", "")), str(entry.get("message_uid", "")))
+
+
+def _delta_message(previous: Dict[str, Any], current: Dict[str, Any]) -> str:
+    before = {_pending_key(entry) for entry in previous.get("pending", [])}
+    after = {_pending_key(entry): entry for entry in current.get("pending", [])}
+    counts = {key: value for key, value in current.items() if key != "pending"}
+    return orjson.dumps(
+        {
+            "type": "pending_delta",
+            "added": [entry for key, entry in after.items() if key not in before],
+            "removed": [{"folder": folder, "message_uid": uid} for folder, uid in before if (folder, uid) not in after],
+            "counts": counts,
+        }
+    ).decode()
+
+
+class PendingStreamHub:
+    """Compute the pending overview once per change and push it to all clients.
+
+    State-changing operations call :meth:`mark_dirty` (safe from any thread). The hub
+    then refreshes the overview a single time and broadcasts it to every connected
+    socket. Clients that already hold the previous snapshot only receive a
+    ``pending_delta``; new or out-of-sync clients and every ``FULL_SNAPSHOT_EVERY``-th
+    update get the full ``pending_overview``. Sends that take longer than
+    ``SEND_TIMEOUT_SECONDS`` are dropped, and clients that stay slow are closed.
+    Because the IMAP worker may run in a separate process, the overview is
+    additionally refreshed every ``POLL_INTERVAL_SECONDS``.
+    """
+
+    def __init__(self) -> None:
+        self._clients: Dict[StreamClient, _ClientState] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._producer: Optional[Producer] = None
+        self._payload: Optional[Dict[str, Any]] = None
+        self._full_message: Optional[str] = None
+        self._stale = True
+        self._updates = 0
+        self._revision = 0
+
+    @property
+    def revision(self) -> int:
+        """Counter bumped on every change; used to invalidate cached overviews."""
+
+        return self._revision
+
+    def mark_dirty(self) -> None:
+        self._revision += 1
+        self._stale = True
+        self._wake_up()
+
+    def subscribe(self, ws: StreamClient, producer: Producer) -> None:
+        self._producer = producer
+        self._clients[ws] = _ClientState()
+        self._ensure_running()
+        self._wake_up()
+
+    def unsubscribe(self, ws: StreamClient) -> None:
+        self._clients.pop(ws, None)
+
+    def _wake_up(self) -> None:
+        loop, wake = self._loop, self._wake
+        if loop is None or wake is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(wake.set)
+        except RuntimeError:  # pragma: no cover - loop shutting down
+            pass
+
+    def _ensure_running(self) -> None:
+        if self._task and not self._task.done():
+            return
+        # Changes made while no client was connected did not reach the stopped loop.
+        self._stale = True
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        assert self._wake is not None
+        wake = self._wake
+        refresh_interval = float(getattr(S, "POLL_INTERVAL_SECONDS", 60)) or 60.0
+        last_refresh = time.monotonic()
+        while self._clients:
+            timeout = min(PING_INTERVAL_SECONDS, max(refresh_interval - (time.monotonic() - last_refresh), 0.0))
+            try:
+                await asyncio.wait_for(wake.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                if time.monotonic() - last_refresh < refresh_interval:
+                    await self._send_all(_PING_MESSAGE)
+                    continue
+                self._stale = True
+            wake.clear()
+            if self._stale or self._full_message is None:
+                last_refresh = time.monotonic()
+                await self._refresh()
+            else:
+                await self._sync_new_clients()
+
+    async def _refresh(self) -> None:
+        assert self._producer is not None
+        self._stale = False
+        try:
+            payload = await self._producer()
+        except Exception as exc:  # pragma: no cover - network/IMAP interaction
+            logger.warning("Failed to stream pending overview: %s", exc)
+            await self._send_all(orjson.dumps({"type": "pending_error", "error": str(exc)}).decode())
+            return
+
+        previous = self._payload
+        self._payload = payload
+        self._full_message = orjson.dumps({"type": "pending_overview", "payload": payload}).decode()
+        self._updates += 1
+        if previous is None or self._updates % FULL_SNAPSHOT_EVERY == 0:
+            await self._send_all(self._full_message, resync=True)
+            return
+        delta = _delta_message(previous, payload)
+        await self._send_each(
+            [(ws, delta if state.synced else self._full_message, True) for ws, state in self._clients.items()]
+        )
+
+    async def _sync_new_clients(self) -> None:
+        assert self._full_message is not None
+        message = self._full_message
+        await self._send_each([(ws, message, True) for ws, state in self._clients.items() if not state.synced])
+
+    async def _send_all(self, message: str, resync: bool = False) -> None:
+        await self._send_each([(ws, message, resync) for ws in self._clients])
+
+    async def _send_each(self, batch: List[Tuple[StreamClient, str, bool]]) -> None:
+        if not batch:
+            return
+        outcomes = await asyncio.gather(
+            *(asyncio.wait_for(ws.send_text(message), timeout=SEND_TIMEOUT_SECONDS) for ws, message, _ in batch),
+            return_exceptions=True,
+        )
+        for (ws, _, resync), outcome in zip(batch, outcomes):
+            state = self._clients.get(ws)
+            if state is None:
+                continue
+            if isinstance(outcome, asyncio.TimeoutError):
+                state.synced = False
+                state.strikes += 1
+                logger.debug("Slow WebSocket client, update dropped (%s strikes)", state.strikes)
+                if state.strikes >= MAX_SLOW_STRIKES:
+                    self._clients.pop(ws, None)
+                    await self._close(ws, 1011)
+            elif isinstance(outcome, BaseException):
+                logger.debug("Dropping WebSocket client after failed send: %s", outcome)
+                self._clients.pop(ws, None)
+            else:
+                state.strikes = 0
+                if resync:
+                    state.synced = True
+
+    @staticmethod
+    async def _close(ws: StreamClient, code: int) -> None:
+        try:
+            await asyncio.wait_for(ws.close(code=code), timeout=SEND_TIMEOUT_SECONDS)
+        except Exception:  # pragma: no cover - connection already gone
+            logger.debug("Failed to close slow WebSocket client", exc_info=True)
+
+
+hub = PendingStreamHub()
+
+
+def mark_dirty() -> None:
+    """Signal that the pending overview has to be recomputed."""
+
+    hub.mark_dirty()
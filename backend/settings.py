@@ -32,6 +32,8 @@ class Settings(BaseSettings):
     EMBED_PROMPT_MAX_CHARS: int = 8000
 
     DATABASE_URL: str = "sqlite:///data/app.db"
+    DATABASE_POOL_SIZE: int = 20
+    DATABASE_MAX_OVERFLOW: int = 10
     INIT_RUN: bool = False
     POLL_INTERVAL_SECONDS: int = 30
     IDLE_FALLBACK: bool = True
@@ -48,8 +50,12 @@ class Settings(BaseSettings):
 
     PENDING_LIST_LIMIT: int = 25
 
+    IMAP_POOL_SIZE: int = 4
+
     DEV_MODE: bool = False
 
+    CORS_ORIGINS: str = "http://localhost:5173,http://127.0.0.1:5173"
+
     ANALYSIS_MODULE: str = "HYBRID"
 
     CALENDAR_SYNC_ENABLED: bool = False
@@ -53,6 +53,8 @@ export interface PendingMail {
   date?: string | null
 }
 
+export type PendingMailRef = Pick<PendingMail, 'folder' | 'message_uid'>
+
 export interface PendingOverview {
   total_messages: number
   processed_count: number
@@ -484,7 +486,9 @@ export interface ScanStopResponse {
 export type StreamEvent =
   | { type: 'hello'; msg: string }
   | { type: 'pending_overview'; payload: PendingOverview }
+  | { type: 'pending_delta'; added: PendingMail[]; removed: PendingMailRef[]; counts: Omit<PendingOverview, 'pending'> }
   | { type: 'pending_error'; error: string }
+  | { type: 'ping' }
 
 const envBase = (import.meta.env.VITE_API_BASE as string | undefined) ?? 'http://localhost:8000'
 const BASE = envBase.replace(/\/$/, '')
@@ -492,6 +496,7 @@ const baseUrl = new URL(BASE)
 const wsProtocol = baseUrl.protocol === 'https:' ? 'wss:' : 'ws:'
 const normalizedPath = baseUrl.pathname.replace(/\/$/, '')
 const STREAM_URL = `${wsProtocol}//${baseUrl.host}${normalizedPath}/ws/stream`
+const PENDING_STREAM_URL = `${baseUrl.protocol}//${baseUrl.host}${normalizedPath}/api/pending/stream`
 
 export const API_BASE_URL = BASE
 export const STREAM_WEBSOCKET_URL = STREAM_URL
@@ -580,6 +585,39 @@ export async function getSuggestions(scope: SuggestionScope = 'open'): Promise<S
   return request<SuggestionsResponse>(`/api/suggestions${query}`)
 }
 
+export async function streamSuggestions(
+  scope: SuggestionScope,
+  onSuggestion: (suggestion: Suggestion) => void,
+): Promise<void> {
+  const query = scope === 'all' ? '?include=all' : ''
+  const path = `/api/suggestions.ndjson${query}`
+  recordDevEvent({ type: 'request', label: `GET ${path}` })
+  const response = await fetch(`${BASE}${path}`)
+  if (!response.ok || !response.body) {
+    const text = await response.text()
+    recordDevEvent({ type: 'error', label: `GET ${path}`, details: `${response.status} ${response.statusText}`, payload: text })
+    throw new Error(text || `${response.status} ${response.statusText}`)
+  }
+  const reader = response.body.pipeThrough(new TextDecoderStream()).getReader()
+  let buffer = ''
+  for (;;) {
+    const { value, done } = await reader.read()
+    if (value) {
+      buffer += value
+    }
+    const lines = buffer.split('\n')
+    buffer = done ? '' : lines.pop() ?? ''
+    for (const line of lines) {
+      if (line.trim()) {
+        onSuggestion(JSON.parse(line) as Suggestion)
+      }
+    }
+    if (done) {
+      return
+    }
+  }
+}
+
 export async function getPendingOverview(): Promise<PendingOverview> {
   return request<PendingOverview>('/api/pending')
 }
@@ -828,3 +866,24 @@ export function openStream(onEvent: (event: StreamEvent) => void): WebSocket {
   }
   return socket
 }
+
+export function openPendingEventSource(onEvent: (event: StreamEvent) => void): EventSource {
+  const source = new EventSource(PENDING_STREAM_URL)
+  recordDevEvent({ type: 'info', label: 'SSE verbinden', details: PENDING_STREAM_URL })
+  source.onmessage = rawEvent => {
+    try {
+      const parsed = JSON.parse(rawEvent.data) as StreamEvent
+      recordDevEvent({ type: 'stream', label: parsed.type, payload: parsed })
+      onEvent(parsed)
+    } catch (error) {
+      recordDevEvent({ type: 'error', label: 'Stream parse error', payload: String(error) })
+    }
+  }
+  source.onerror = event => {
+    recordDevEvent({ type: 'error', label: 'SSE Fehler', payload: event })
+  }
+  source.onopen = () => {
+    recordDevEvent({ type: 'info', label: 'SSE geöffnet' })
+  }
+  return source
+}
@@ -1,7 +1,29 @@
 import { useCallback, useEffect, useRef, useState } from 'react'
-import { PendingOverview, StreamEvent, getPendingOverview, openStream } from '../api'
+import { PendingMail, PendingMailRef, PendingOverview, StreamEvent, getPendingOverview, openStream } from '../api'
 import { recordDevEvent } from '../devtools'
 
+const pendingKey = (item: PendingMailRef): string => `${item.folder}\u0000${item.message_uid}`
+
+// Plain code-unit comparison, matching the backend's Python string sort of (folder, message_uid).
+const compareText = (a: string, b: string): number => (a < b ? -1 : a > b ? 1 : 0)
+
+function applyPendingDelta(
+  current: PendingOverview | null,
+  added: PendingMail[],
+  removed: PendingMailRef[],
+  counts: Omit<PendingOverview, 'pending'>,
+): PendingOverview | null {
+  if (!current) {
+    return current
+  }
+  const removedKeys = new Set(removed.map(pendingKey))
+  const pending = current.pending
+    .filter(item => !removedKeys.has(pendingKey(item)))
+    .concat(added)
+    .sort((a, b) => compareText(a.folder, b.folder) || compareText(a.message_uid, b.message_uid))
+  return { ...current, ...counts, pending }
+}
+
 export interface PendingOverviewState {
   data: PendingOverview | null
   loading: boolean
@@ -83,6 +105,9 @@ export function usePendingOverview(enabled = true): PendingOverviewState {
           setError(null)
           setLoading(false)
           recordDevEvent({ type: 'stream', label: 'pending_overview', payload: event.payload })
+        } else if (event.type === 'pending_delta') {
+          setData(current => applyPendingDelta(current, event.added, event.removed, event.counts))
+          setError(null)
         } else if (event.type === 'pending_error') {
           setError(event.error)
           setLoading(false)